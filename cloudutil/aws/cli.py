@@ -1,23 +1,17 @@
 """CLI interface for cloudutil."""
 
-import json
-import webbrowser
 from pathlib import Path
 from typing import Optional
 
+import orjson
 import typer
 import os
 from tempfile import TemporaryDirectory
-import boto3
 
 from ..utils import console
-from .login import generate_federated_console_url
-from .ssm import (
-    EC2InstanceView,
-    search_parameters_with_fzf,
-)
-from .sts import decode_authorization_failure_message
-from .secrets import search_secrets_with_fzf
+
+# Command implementations (and botocore/requests behind them) are imported
+# inside each command so `cu --help` and unrelated commands skip their cost.
 
 app = typer.Typer(
     pretty_exceptions_enable=False,
@@ -30,10 +24,10 @@ def login(
         None, "--profile", "-p", help="AWS CLI profile name to use."
     ),
     region: Optional[str] = typer.Option(
-        "us-east-1",
+        None,
         "--region",
         "-r",
-        help="AWS region for STS client (e.g., us-east-1). STS is global, but client can be regional.",
+        help="AWS region for STS and the console (e.g., us-east-1). Defaults to AWS_REGION/AWS_DEFAULT_REGION, then the profile's region, then us-east-1.",
     ),
     duration: int = typer.Option(
         2,
@@ -67,19 +61,18 @@ def login(
         print("No policy file provided, use -f <policy_file>.json")
         raise typer.Exit(code=1)
 
-    boto_sess = boto3.session.Session()
-    try:
-        region = boto_sess.region_name
-    except Exception:
-        region = "us-east-1"
+    import webbrowser
+
+    from .login import console_region, generate_federated_console_url
+
+    region = console_region(profile, region)
 
     policy_doc = None
     destination = f"https://{region}.console.aws.amazon.com/"
 
     if policy_file:
         try:
-            with policy_file.open("r") as f:
-                policy_doc = json.load(f)
+            policy_doc = orjson.loads(policy_file.read_bytes())
             console.print(
                 f"[*] Using policy from file: [bold cyan]{policy_file}[/bold cyan]"
             )
@@ -137,13 +130,23 @@ def ssm_parameters(
     region: Optional[str] = typer.Option(
         None, "--region", "-r", help="AWS region to use."
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Ignore cached listings and values and fetch fresh ones.",
+    ),
 ):
     """
     Search SSM parameters interactively using fzf for selection.
     """
+    from .ssm import search_parameters_with_fzf
+
     try:
         search_parameters_with_fzf(
-            prefix=prefix, profile_name=profile, region_name=region
+            prefix=prefix,
+            profile_name=profile,
+            region_name=region,
+            use_cache=not no_cache,
         )
 
     except Exception as e:
@@ -162,6 +165,8 @@ def ec2_ssm(
     ),
     local_port: int = typer.Option(0, "--local-port", help="Local port to tunnel to"),
 ):
+    from .ssm import EC2InstanceView
+
     EC2InstanceView(
         tunnel=tunnel,
         remote_host=remote_host,
@@ -181,13 +186,21 @@ def secrets(
     region: Optional[str] = typer.Option(
         None, "--region", "-r", help="AWS region to use."
     ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Ignore cached listings and fetch fresh ones."
+    ),
 ):
     """
     Search Secrets Manager secrets interactively using fzf for selection.
     """
+    from .secrets import search_secrets_with_fzf
+
     try:
         search_secrets_with_fzf(
-            name_filter=name_filter, profile_name=profile, region_name=region
+            name_filter=name_filter,
+            profile_name=profile,
+            region_name=region,
+            use_cache=not no_cache,
         )
 
         # if not secrets:
@@ -226,6 +239,7 @@ def decode_message(
     """
     Decode an AWS authorization failure message using IAM's decode_authorization_message API.
     """
+    from .sts import decode_authorization_failure_message
 
     # create a temporary directory to store the encoded message
     with TemporaryDirectory() as tempdir:
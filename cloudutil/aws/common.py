@@ -1,15 +1,33 @@
 """Common AWS utilities and session management."""
 
-import boto3
-from typing import Optional
+from __future__ import annotations
 
+import os
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional
 
+if TYPE_CHECKING:
+    import boto3
+    from botocore.config import Config
+
+
+# botocore sessions are not safe to create clients from concurrently.
+_client_lock = threading.Lock()
+
+
+@lru_cache(maxsize=32)
 def get_aws_session(
     profile_name: Optional[str] = None, region_name: Optional[str] = None
 ) -> boto3.Session:
     """
     Get AWS session with optional profile and region.
 
+    Sessions are cached per ``(profile_name, region_name)``, so the AWS
+    config/credentials files are read and the credential chain resolved
+    once per process. Clients created from one session also share its
+    loaded service models.
+
     Args:
         profile_name: AWS profile to use
         region_name: AWS region to use
@@ -17,6 +35,9 @@ def get_aws_session(
     Returns:
         Configured boto3 Session
     """
+    # Imported here so commands that never call AWS skip boto3's import cost.
+    import boto3
+
     if profile_name and region_name:
         return boto3.Session(profile_name=profile_name, region_name=region_name)
     elif profile_name:
@@ -27,21 +48,76 @@ def get_aws_session(
         return boto3.Session()
 
 
+@lru_cache(maxsize=1)
+def tuned_client_config() -> Config:
+    """
+    Return the botocore client config used for latency-sensitive clients.
+
+    Adaptive retries back off on throttling (e.g. a burst of SSM reads), the
+    larger pool lets threaded callers share one client without waiting on
+    connections, and the timeouts fail fast instead of hanging on a bad
+    network.
+    """
+    from botocore.config import Config
+
+    return Config(
+        retries={"mode": "adaptive", "max_attempts": 4},
+        tcp_keepalive=True,
+        max_pool_connections=32,
+        connect_timeout=3,
+        read_timeout=10,
+    )
+
+
+@lru_cache(maxsize=64)
 def get_aws_client(
     service_name: str,
     profile_name: Optional[str] = None,
     region_name: Optional[str] = None,
+    config: Optional[Config] = None,
 ):
     """
     Get AWS service client with optional profile and region.
 
+    Clients are cached per argument tuple, so every caller (including the
+    EC2 instance listing) reuses one client per service and identity.
+    *config* is keyed by identity; pass a shared object such as
+    ``tuned_client_config()``.
+
     Args:
         service_name: AWS service name (e.g., 'ssm', 'secretsmanager')
         profile_name: AWS profile to use
         region_name: AWS region to use
+        config: Optional botocore client config
 
     Returns:
         Configured boto3 client for the specified service
     """
     session = get_aws_session(profile_name, region_name)
-    return session.client(service_name)
+    with _client_lock:
+        return session.client(service_name, config=config)
+
+
+def cache_scope(
+    profile_name: Optional[str] = None, region_name: Optional[str] = None
+) -> List[Optional[str]]:
+    """
+    Return the parts of a cache key that identify the effective AWS identity.
+
+    Keys on the access key ID the credentials resolve to, plus the region,
+    so cached data is never reused for a different identity. Env credentials
+    are read directly; any other source (default profile, SSO, roles) is
+    resolved through the boto3 session.
+    """
+    access_key = os.getenv("AWS_ACCESS_KEY_ID")
+    if not profile_name and access_key and os.getenv("AWS_SECRET_ACCESS_KEY"):
+        # Env keys beat AWS_PROFILE unless a profile was passed explicitly,
+        # as in botocore, so boto3 is not needed to know the identity.
+        return [
+            access_key,
+            region_name or os.getenv("AWS_REGION") or os.getenv("AWS_DEFAULT_REGION"),
+        ]
+
+    session = get_aws_session(profile_name, region_name)
+    credentials = session.get_credentials()
+    return [credentials.access_key if credentials else None, session.region_name]
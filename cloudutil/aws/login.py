@@ -1,14 +1,89 @@
 """AWS console login URL generation using STS GetFederationToken."""
 
 import os
-import boto3
-import botocore.exceptions
+import sys
 import requests
 import json
 import urllib.parse
+from functools import lru_cache
 from typing import Optional
 
-from ..utils import console
+from requests.adapters import HTTPAdapter
+
+from ..utils import cache_get, cache_set, console
+from .common import cache_scope
+from .sigv4 import Credentials, STSError, env_credentials, sts_request
+
+# The federation endpoint's sign-in token is only valid for 15 minutes, so a
+# cached login URL can never outlive that, whatever the session duration.
+_SIGNIN_TOKEN_LIFETIME = 15 * 60
+# Drop cached URLs this long before they expire so we never hand out one
+# that dies while the browser is opening.
+_EXPIRY_SKEW = 60
+
+# One pooled session for the STS and sign-in endpoint calls so TLS
+# connections are reused instead of torn down after every request.
+_http = requests.Session()
+_http.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
+
+
+def _direct_credentials(profile_name: Optional[str]) -> Optional[Credentials]:
+    """
+    Return env credentials to sign STS calls with directly, if they apply.
+
+    Mirrors botocore precedence: an explicit profile wins; otherwise
+    AWS_ACCESS_KEY_ID/AWS_SECRET_ACCESS_KEY beat AWS_PROFILE.
+    """
+    return None if profile_name else env_credentials()
+
+
+def console_region(profile_name: Optional[str], region_name: Optional[str]) -> str:
+    """
+    Return the region to open the console in.
+
+    An explicit region wins, then AWS_REGION/AWS_DEFAULT_REGION. Only when
+    neither is set and the credentials come from a profile is a boto3
+    session built to read the profile's configured region.
+    """
+    region = region_name or os.getenv("AWS_REGION") or os.getenv("AWS_DEFAULT_REGION")
+    if region:
+        return region
+    if _direct_credentials(profile_name):
+        return "us-east-1"
+
+    from .common import get_aws_session
+
+    return get_aws_session(profile_name).region_name or "us-east-1"
+
+
+@lru_cache(maxsize=16)
+def _caller_identity(profile_name: Optional[str], region_name: Optional[str]) -> dict:
+    """Return STS GetCallerIdentity for the profile, cached for the process."""
+    credentials = _direct_credentials(profile_name)
+    if credentials:
+        return sts_request(
+            "GetCallerIdentity", {}, credentials, region_name or "us-east-1", _http
+        )
+
+    # Only pay for boto3 when credentials must come from the provider chain.
+    from .sts import get_sts_client
+
+    return get_sts_client(profile_name, region_name).get_caller_identity()
+
+
+def _federation_token(
+    profile_name: Optional[str], region_name: Optional[str], params: dict
+) -> dict:
+    """Return the STS GetFederationToken response for *params*."""
+    credentials = _direct_credentials(profile_name)
+    if credentials:
+        return sts_request(
+            "GetFederationToken", params, credentials, region_name or "us-east-1", _http
+        )
+
+    from .sts import get_sts_client
+
+    return get_sts_client(profile_name, region_name).get_federation_token(**params)
 
 
 def generate_federated_console_url(
@@ -36,17 +111,21 @@ def generate_federated_console_url(
         region_msg = f", region: [bold cyan]{region_name if region_name else 'default (from profile/env)'}[/]"
         console.print(f"[*] Using AWS ({profile_msg}{region_msg})")
 
-        session_kwargs = {}
-        if profile_name:
-            session_kwargs["profile_name"] = profile_name
-        if region_name:
-            # Note: STS is a global service, but client can be regional for endpoint discovery.
-            # Explicitly setting region for STS client is often not needed unless sourcing creds from a specific region.
-            session_kwargs["region_name"] = region_name
-
-        aws_session = boto3.Session(**session_kwargs)
-        sts_client = aws_session.client("sts")
-        caller_identity = sts_client.get_caller_identity()
+        # The URL is a bearer credential: key it on the access key ID the
+        # credentials resolve to, so it is never handed to another identity.
+        cache_key = [
+            *cache_scope(profile_name, region_name),
+            duration_seconds,
+            policy_document,
+            destination_url,
+        ]
+        cached_url = cache_get("federation", cache_key)
+        if cached_url:
+            console.print("[green][+][/green] Reusing cached console login URL.")
+            return cached_url
+
+        # Note: STS is a global service, but client can be regional for endpoint discovery.
+        caller_identity = _caller_identity(profile_name, region_name)
         iam_arn = caller_identity["Arn"]
         iam_username = iam_arn.split("/")[-1]
         # Ensure Name length <= 32 characters for federation token requirement
@@ -63,7 +142,7 @@ def generate_federated_console_url(
             sts_params["Policy"] = json.dumps(policy_document)
             console.print("[*] Applying inline policy to the federated session.")
 
-        response = sts_client.get_federation_token(**sts_params)
+        response = _federation_token(profile_name, region_name, sts_params)
         creds = response["Credentials"]
         console.print("[green][+][/green] Federation token received.")
 
@@ -83,7 +162,7 @@ def generate_federated_console_url(
             "SessionDuration": duration_seconds,  # Can be redundant if already in token time an
         }
 
-        r = requests.get(signin_token_request_url, params=signin_token_params)
+        r = _http.get(signin_token_request_url, params=signin_token_params)
         r.raise_for_status()
 
         signin_token = r.json()["SigninToken"]
@@ -101,15 +180,16 @@ def generate_federated_console_url(
         console.print(
             f"[green][+][/green] Console login URL generated (short-lived for login, session valid for {duration_seconds}s)."
         )
+        cache_set(
+            "federation",
+            cache_key,
+            login_url,
+            ttl=min(duration_seconds, _SIGNIN_TOKEN_LIFETIME) - _EXPIRY_SKEW,
+        )
         return login_url
 
-    except botocore.exceptions.NoCredentialsError:
-        console.print(
-            "[bold red][!] ERROR: AWS credentials not found. Configure AWS CLI or set environment variables.[/bold red]"
-        )
-        return None
-    except botocore.exceptions.BotoCoreError as e:
-        console.print(f"[bold red][!] ERROR (Boto3): {e}[/bold red]")
+    except STSError as e:
+        console.print(f"[bold red][!] ERROR (STS): {e}[/bold red]")
         return None
     except requests.exceptions.RequestException as e:
         console.print(f"[bold red][!] ERROR (Requests): {e}[/bold red]")
@@ -120,5 +200,17 @@ def generate_federated_console_url(
         )
         return None
     except Exception as e:
-        console.print(f"[bold red][!] An unexpected error occurred: {e}[/bold red]")
+        # botocore is only imported on the provider-chain path, so its
+        # exceptions can only be raised once it is in sys.modules.
+        botocore_exceptions = sys.modules.get("botocore.exceptions")
+        if botocore_exceptions and isinstance(
+            e, botocore_exceptions.NoCredentialsError
+        ):
+            console.print(
+                "[bold red][!] ERROR: AWS credentials not found. Configure AWS CLI or set environment variables.[/bold red]"
+            )
+        elif botocore_exceptions and isinstance(e, botocore_exceptions.BotoCoreError):
+            console.print(f"[bold red][!] ERROR (Boto3): {e}[/bold red]")
+        else:
+            console.print(f"[bold red][!] An unexpected error occurred: {e}[/bold red]")
         return None
@@ -1,16 +1,18 @@
 """AWS Secrets Manager utilities."""
 
-import json
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional
 
-from pydantic import BaseModel
+import orjson
 
 from ..helper.fzf_view import FzfView
-from ..utils import console
-from .common import get_aws_client
+from ..utils import LIST_CACHE_TTL, cache_get, cache_set, console
+from .common import cache_scope, get_aws_client, tuned_client_config
 
 
-class Secret(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Secret:
     """Secret model."""
 
     name: str
@@ -19,21 +21,51 @@ class Secret(BaseModel):
     description: Optional[str] = None
 
 
+@lru_cache(maxsize=32)
 def get_secrets_client(
     profile_name: Optional[str] = None, region_name: Optional[str] = None
 ):
-    """Get Secrets Manager client with optional profile and region."""
-    return get_aws_client("secretsmanager", profile_name, region_name)
+    """
+    Get Secrets Manager client with optional profile and region.
 
+    Clients are cached per ``(profile_name, region_name)`` so listing and
+    the per-secret fetches share one client and its connection pool.
+    """
+    return get_aws_client(
+        "secretsmanager", profile_name, region_name, tuned_client_config()
+    )
 
-def list_secrets(
+
+def iter_secrets(
     name_filter: Optional[str] = None,
     profile_name: Optional[str] = None,
     region_name: Optional[str] = None,
-) -> List[str]:
-    """List Secrets Manager secret names."""
+    use_cache: bool = True,
+    descriptions: Optional[Dict[str, Optional[str]]] = None,
+) -> Iterator[str]:
+    """
+    Yield Secrets Manager secret names, page by page.
+
+    With *use_cache*, a listing from the last ``LIST_CACHE_TTL`` seconds is
+    replayed without calling Secrets Manager. A fresh listing is only cached
+    once it has been consumed completely.
+
+    When *descriptions* is given it is filled with each secret's
+    ``Description`` from ``ListSecrets``, so callers need not describe the
+    secret again later.
+    """
+    cache_key = ["secrets-list", name_filter, *cache_scope(profile_name, region_name)]
+    if use_cache:
+        cached = cache_get("listings", cache_key)
+        if cached is not None:
+            if descriptions is not None:
+                descriptions.update(cached)
+            yield from cached
+            return
+
     secrets_client = get_secrets_client(profile_name, region_name)
-    secrets = []
+    # name -> Description, in listing order; cached as the listing itself.
+    secrets: Dict[str, Optional[str]] = {}
     next_token = None
 
     while True:
@@ -45,29 +77,51 @@ def list_secrets(
 
         response = secrets_client.list_secrets(**kwargs)
         for secret in response["SecretList"]:
-            secrets.append(secret["Name"])
+            secrets[secret["Name"]] = secret.get("Description")
+            if descriptions is not None:
+                descriptions[secret["Name"]] = secret.get("Description")
+            yield secret["Name"]
         next_token = response.get("NextToken")
         if not next_token:
             break
 
-    return secrets
+    cache_set("listings", cache_key, secrets, ttl=LIST_CACHE_TTL)
+
+
+def list_secrets(
+    name_filter: Optional[str] = None,
+    profile_name: Optional[str] = None,
+    region_name: Optional[str] = None,
+    use_cache: bool = True,
+    descriptions: Optional[Dict[str, Optional[str]]] = None,
+) -> List[str]:
+    """List Secrets Manager secret names."""
+    return list(
+        iter_secrets(name_filter, profile_name, region_name, use_cache, descriptions)
+    )
 
 
 def get_secret(
     name: str,
     profile_name: Optional[str] = None,
     region_name: Optional[str] = None,
+    description: Optional[str] = None,
 ) -> Secret:
-    """Get a specific secret by name."""
+    """
+    Get a specific secret by name.
+
+    Only ``GetSecretValue`` is called; it already returns the name and ARN.
+    The description is not part of that response, so callers pass the one
+    ``ListSecrets`` returned (see ``iter_secrets``'s *descriptions*).
+    """
     secrets_client = get_secrets_client(profile_name, region_name)
-    describe_response = secrets_client.describe_secret(SecretId=name)
-    value_response = secrets_client.get_secret_value(SecretId=name)
+    response = secrets_client.get_secret_value(SecretId=name)
 
     return Secret(
-        name=describe_response["Name"],
-        value=value_response["SecretString"],
-        arn=describe_response["ARN"],
-        description=describe_response.get("Description"),
+        name=response["Name"],
+        value=response["SecretString"],
+        arn=response["ARN"],
+        description=description,
     )
 
 
@@ -79,8 +133,8 @@ def get_secret_json(
     """Get a secret value and parse it as JSON."""
     secret = get_secret(name, profile_name, region_name)
     try:
-        return json.loads(secret.value)
-    except json.JSONDecodeError as e:
+        return orjson.loads(secret.value)
+    except orjson.JSONDecodeError as e:
         console.print(
             f"[bold red][!] ERROR: Failed to parse secret as JSON: {e}[/bold red]"
         )
@@ -100,19 +154,24 @@ class AwsSecretsView(FzfView[str]):
 
     item_type_name = "AWS secret"
     multi_select = True
+    max_workers = 16
+    stream_items = True
 
     def __init__(
         self,
         name_filter: Optional[str] = None,
         profile_name: Optional[str] = None,
         region_name: Optional[str] = None,
+        use_cache: bool = True,
     ) -> None:
         self._name_filter = name_filter
         self._profile_name = profile_name
         self._region_name = region_name
+        self._use_cache = use_cache
         self._selected_secrets: List[Secret] = []
+        self._descriptions: Dict[str, Optional[str]] = {}
 
-    def list_items(self) -> List[str]:
+    def _announce_listing(self) -> None:
         console.print(
             "[*] Listing secrets"
             + (
@@ -121,15 +180,42 @@ class AwsSecretsView(FzfView[str]):
                 else ""
             )
         )
-        return list_secrets(self._name_filter, self._profile_name, self._region_name)
+
+    def before_stream(self) -> None:
+        # Streamed listings hand the terminal to fzf before the first page.
+        self._announce_listing()
+
+    def list_items(self) -> List[str]:
+        self._announce_listing()
+        return list_secrets(
+            self._name_filter,
+            self._profile_name,
+            self._region_name,
+            self._use_cache,
+            self._descriptions,
+        )
+
+    def iter_items(self) -> Iterator[str]:
+        yield from iter_secrets(
+            self._name_filter,
+            self._profile_name,
+            self._region_name,
+            self._use_cache,
+            self._descriptions,
+        )
 
     def item_label(self, item: str) -> str:
         return item
 
     def display_item(self, item: str) -> dict[str, dict]:
-        secret = get_secret(item, self._profile_name, self._region_name)
+        secret = get_secret(
+            item,
+            self._profile_name,
+            self._region_name,
+            description=self._descriptions.get(item),
+        )
         self._selected_secrets.append(secret)
-        return {secret.name: json.loads(secret.value)}
+        return {secret.name: orjson.loads(secret.value)}
 
 
 # ── Convenience function (backwards-compatible) ───────────────────────────────
@@ -139,6 +225,7 @@ def search_secrets_with_fzf(
     name_filter: Optional[str] = None,
     profile_name: Optional[str] = None,
     region_name: Optional[str] = None,
+    use_cache: bool = True,
 ) -> List[Secret]:
     """
     Search secrets using fzf for interactive selection.
@@ -150,5 +237,6 @@ def search_secrets_with_fzf(
         name_filter=name_filter,
         profile_name=profile_name,
         region_name=region_name,
+        use_cache=use_cache,
     )
     view.run()
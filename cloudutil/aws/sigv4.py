@@ -0,0 +1,156 @@
+"""Minimal SigV4-signed STS Query API calls that do not need boto3.
+
+Used for the console-login fast path when credentials are supplied through
+environment variables: two STS calls do not justify importing boto3/botocore
+and loading their service models.
+"""
+
+import hashlib
+import hmac
+import os
+import urllib.parse
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from typing import Any, NamedTuple, Optional
+
+import requests
+
+STS_API_VERSION = "2011-06-15"
+
+
+class Credentials(NamedTuple):
+    """Static AWS credentials used to sign a request."""
+
+    access_key: str
+    secret_key: str
+    token: Optional[str] = None
+
+
+class STSError(Exception):
+    """STS returned an error response."""
+
+    def __init__(self, code: str, message: str):
+        super().__init__(f"{code}: {message}")
+        self.code = code
+        self.message = message
+
+
+def env_credentials() -> Optional[Credentials]:
+    """Return credentials from AWS_* environment variables, if both keys are set."""
+    access_key = os.getenv("AWS_ACCESS_KEY_ID")
+    secret_key = os.getenv("AWS_SECRET_ACCESS_KEY")
+    if not access_key or not secret_key:
+        return None
+    return Credentials(access_key, secret_key, os.getenv("AWS_SESSION_TOKEN"))
+
+
+def _hmac(key: bytes, msg: str) -> bytes:
+    return hmac.new(key, msg.encode(), hashlib.sha256).digest()
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _to_dict(elem: ET.Element) -> Any:
+    """Convert an STS XML element to the dict shape boto3 would return."""
+    children = list(elem)
+    if not children:
+        return elem.text or ""
+    return {_local_name(child.tag): _to_dict(child) for child in children}
+
+
+def sts_request(
+    action: str,
+    params: dict[str, Any],
+    credentials: Credentials,
+    region: str = "us-east-1",
+    session: Optional[requests.Session] = None,
+) -> dict[str, Any]:
+    """
+    Call an STS Query API action and return its ``<Action>Result`` as a dict.
+
+    Args:
+        action: STS action name (e.g. 'GetCallerIdentity')
+        params: Action parameters, sent form-encoded
+        credentials: Credentials used for SigV4 signing
+        region: Region of the STS endpoint to call and sign for
+        session: Optional requests session to reuse connections
+
+    Raises:
+        STSError: If STS answers with an error document
+        requests.exceptions.RequestException: On transport errors
+    """
+    suffix = "amazonaws.com.cn" if region.startswith("cn-") else "amazonaws.com"
+    host = f"sts.{region}.{suffix}"
+    body = urllib.parse.urlencode(
+        {"Action": action, "Version": STS_API_VERSION, **params}
+    )
+
+    now = datetime.now(timezone.utc)
+    amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+    date_stamp = now.strftime("%Y%m%d")
+
+    headers = {
+        "content-type": "application/x-www-form-urlencoded; charset=utf-8",
+        "host": host,
+        "x-amz-date": amz_date,
+    }
+    if credentials.token:
+        headers["x-amz-security-token"] = credentials.token
+
+    signed_headers = ";".join(sorted(headers))
+    canonical_headers = "".join(f"{k}:{headers[k]}\n" for k in sorted(headers))
+    canonical_request = "\n".join(
+        [
+            "POST",
+            "/",
+            "",
+            canonical_headers,
+            signed_headers,
+            hashlib.sha256(body.encode()).hexdigest(),
+        ]
+    )
+    scope = f"{date_stamp}/{region}/sts/aws4_request"
+    string_to_sign = "\n".join(
+        [
+            "AWS4-HMAC-SHA256",
+            amz_date,
+            scope,
+            hashlib.sha256(canonical_request.encode()).hexdigest(),
+        ]
+    )
+
+    signing_key = _hmac(f"AWS4{credentials.secret_key}".encode(), date_stamp)
+    for part in (region, "sts", "aws4_request"):
+        signing_key = _hmac(signing_key, part)
+    signature = hmac.new(
+        signing_key, string_to_sign.encode(), hashlib.sha256
+    ).hexdigest()
+
+    headers["authorization"] = (
+        f"AWS4-HMAC-SHA256 Credential={credentials.access_key}/{scope}, "
+        f"SignedHeaders={signed_headers}, Signature={signature}"
+    )
+    headers.pop("host")  # requests sets Host itself
+
+    http = session or requests
+    r = http.post(f"https://{host}/", data=body, headers=headers, timeout=10)
+
+    if r.status_code != 200:
+        try:
+            error = ET.fromstring(r.content).find(".//{*}Error")
+        except ET.ParseError:
+            error = None
+        if error is None:
+            r.raise_for_status()
+            raise STSError(f"HTTP{r.status_code}", r.text[:200])
+        raise STSError(
+            error.findtext("{*}Code", default="Unknown"),
+            error.findtext("{*}Message", default=""),
+        )
+
+    result = ET.fromstring(r.content).find(f"{{*}}{action}Result")
+    if result is None:
+        raise STSError("MalformedResponse", f"No {action}Result in STS response")
+    return _to_dict(result)
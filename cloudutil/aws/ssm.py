@@ -1,57 +1,85 @@
 """AWS SSM (Systems Manager) Parameter Store utilities."""
 
-import os
-from typing import List, Optional
-
-from pydantic import BaseModel
+import json
+import signal
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Iterator, List, NamedTuple, Optional
 
 from ..helper.fzf_view import FzfView
-from ..utils import console
-from .common import get_aws_client
+from ..utils import LIST_CACHE_TTL, cache_get, cache_set, console
+from .common import cache_scope, get_aws_client, tuned_client_config
 
 
-class SSMParameter(BaseModel):
+@dataclass(slots=True, frozen=True)
+class SSMParameter:
     """SSM Parameter model."""
 
     name: str
     value: str
 
 
+@lru_cache(maxsize=32)
 def get_ssm_client(
     profile_name: Optional[str] = None, region_name: Optional[str] = None
 ):
-    """Get SSM client with optional profile and region."""
-    return get_aws_client("ssm", profile_name, region_name)
+    """
+    Get SSM client with optional profile and region.
 
+    Clients are cached per ``(profile_name, region_name)`` so the credential
+    provider chain is resolved once per process instead of once per call.
+    """
+    return get_aws_client("ssm", profile_name, region_name, tuned_client_config())
 
-def list_parameters(
+
+def iter_parameters(
     prefix: str = "/",
     profile_name: Optional[str] = None,
     region_name: Optional[str] = None,
-) -> List[str]:
-    """List SSM parameters by path prefix."""
+    use_cache: bool = True,
+) -> Iterator[str]:
+    """
+    Yield SSM parameter names under a path prefix, page by page.
+
+    With *use_cache*, a listing from the last ``LIST_CACHE_TTL`` seconds is
+    replayed without calling SSM. A fresh listing is only cached once it has
+    been consumed completely.
+    """
+    cache_key = ["ssm-list", prefix, *cache_scope(profile_name, region_name)]
+    if use_cache:
+        cached = cache_get("listings", cache_key)
+        if cached is not None:
+            yield from cached
+            return
+
+    names: List[str] = []
     ssm_client = get_ssm_client(profile_name, region_name)
-    parameters = []
-    next_token = None
-
-    while True:
-        kwargs: dict = {
-            "Path": prefix,
-            "Recursive": True,
-            "WithDecryption": True,
-            "MaxResults": 10,
-        }
-        if next_token:
-            kwargs["NextToken"] = next_token
+    paginator = ssm_client.get_paginator("get_parameters_by_path")
+    # Only names are collected here, so skip decryption; values are decrypted
+    # on demand in get_parameter.
+    pages = paginator.paginate(
+        Path=prefix,
+        Recursive=True,
+        WithDecryption=False,
+        PaginationConfig={"PageSize": 10},
+    )
+    for page in pages:
+        for param in page["Parameters"]:
+            names.append(param["Name"])
+            yield param["Name"]
+    cache_set("listings", cache_key, names, ttl=LIST_CACHE_TTL)
 
-        response = ssm_client.get_parameters_by_path(**kwargs)
-        for param in response["Parameters"]:
-            parameters.append(param["Name"])
-        next_token = response.get("NextToken")
-        if not next_token:
-            break
 
-    return parameters
+def list_parameters(
+    prefix: str = "/",
+    profile_name: Optional[str] = None,
+    region_name: Optional[str] = None,
+    use_cache: bool = True,
+) -> List[str]:
+    """List SSM parameters by path prefix."""
+    return list(iter_parameters(prefix, profile_name, region_name, use_cache))
 
 
 def get_parameter(
@@ -66,6 +94,80 @@ def get_parameter(
     return SSMParameter(name=param["Name"], value=param["Value"])
 
 
+# GetParameters accepts at most 10 names per call.
+_GET_PARAMETERS_BATCH_SIZE = 10
+
+# Concurrent GetParameters calls for large selections.
+_GET_PARAMETERS_MAX_WORKERS = 8
+
+# How long plain (non-SecureString) parameter values are reused across
+# invocations. SecureString values are never written to the cache.
+VALUE_CACHE_TTL = 60
+
+
+def get_parameters_batch(
+    names: Iterable[str],
+    profile_name: Optional[str] = None,
+    region_name: Optional[str] = None,
+    use_cache: bool = False,
+) -> Iterator[SSMParameter]:
+    """
+    Get several SSM parameters by name using batched GetParameters calls.
+
+    Batches are fetched concurrently; parameters are yielded in the order of
+    *names*. With *use_cache*, plain ``String``/``StringList`` values fetched
+    in the last ``VALUE_CACHE_TTL`` seconds are reused without calling SSM.
+
+    Names that SSM reports as invalid (e.g. deleted since listing) are
+    reported on the console and skipped.
+    """
+    names = list(names)
+    scope = cache_scope(profile_name, region_name)
+    values: dict[str, str] = {}
+    if use_cache:
+        for name in names:
+            cached = cache_get("ssm-values", [name, *scope])
+            if cached is not None:
+                values[name] = cached
+    pending = [name for name in names if name not in values]
+
+    if pending:
+        ssm_client = get_ssm_client(profile_name, region_name)
+        chunks = [
+            pending[start : start + _GET_PARAMETERS_BATCH_SIZE]
+            for start in range(0, len(pending), _GET_PARAMETERS_BATCH_SIZE)
+        ]
+
+        def fetch(chunk: List[str]) -> dict:
+            return ssm_client.get_parameters(Names=chunk, WithDecryption=True)
+
+        if len(chunks) > 1:
+            # botocore clients are thread-safe.
+            with ThreadPoolExecutor(
+                max_workers=min(_GET_PARAMETERS_MAX_WORKERS, len(chunks))
+            ) as ex:
+                responses = list(ex.map(fetch, chunks))
+        else:
+            responses = [fetch(chunk) for chunk in chunks]
+
+        for response in responses:
+            for param in response["Parameters"]:
+                if use_cache and param.get("Type") != "SecureString":
+                    cache_set(
+                        "ssm-values",
+                        [param["Name"], *scope],
+                        param["Value"],
+                        ttl=VALUE_CACHE_TTL,
+                    )
+                values[param["Name"]] = param["Value"]
+            for missing in response.get("InvalidParameters", []):
+                console.print(f"[yellow][!] Parameter not found: {missing}[/yellow]")
+
+    for name in names:
+        if name in values:
+            yield SSMParameter(name=name, value=values[name])
+
+
 # ── FzfView subclass ──────────────────────────────────────────────────────────
 
 
@@ -79,23 +181,39 @@ class SSMParametersView(FzfView[str]):
 
     item_type_name = "SSM parameter"
     multi_select = True
+    stream_items = True
 
     def __init__(
         self,
         prefix: str = "/",
         profile_name: Optional[str] = None,
         region_name: Optional[str] = None,
+        use_cache: bool = True,
     ) -> None:
         self._prefix = prefix
         self._profile_name = profile_name
         self._region_name = region_name
+        self._use_cache = use_cache
         self._selected_params: List[SSMParameter] = []
 
-    def list_items(self) -> List[str]:
+    def _announce_listing(self) -> None:
         console.print(
             f"[*] Listing SSM parameters with prefix: [bold cyan]{self._prefix}[/bold cyan]"
         )
-        return list_parameters(self._prefix, self._profile_name, self._region_name)
+
+    def before_stream(self) -> None:
+        self._announce_listing()
+
+    def list_items(self) -> List[str]:
+        self._announce_listing()
+        return list_parameters(
+            self._prefix, self._profile_name, self._region_name, self._use_cache
+        )
+
+    def iter_items(self) -> Iterator[str]:
+        yield from iter_parameters(
+            self._prefix, self._profile_name, self._region_name, self._use_cache
+        )
 
     def item_label(self, item: str) -> str:
         return item
@@ -105,6 +223,16 @@ class SSMParametersView(FzfView[str]):
         self._selected_params.append(param)
         return {param.name: param.value}
 
+    def display_selection(self, items: List[str]) -> None:
+        """Fetch all selected parameters in batches, then render them."""
+        params = list(
+            get_parameters_batch(
+                items, self._profile_name, self._region_name, self._use_cache
+            )
+        )
+        self._selected_params.extend(params)
+        self.print_json({param.name: param.value for param in params})
+
 
 # ── EC2 / SSM Session helpers (unchanged) ────────────────────────────────────
 
@@ -125,38 +253,89 @@ def ssm_instance(
             )
             return
 
-        os.system(
-            f"aws ssm start-session --target {instance_id} "
-            f"--document-name {document_name} "
-            f"--parameters '{{'host': ['{remote_host}'], "
-            f"'portNumber': ['{remote_port}'], "
-            f"'localPortNumber': ['{local_port}']}}'",
+        parameters = {
+            "host": [remote_host],
+            "portNumber": [str(remote_port)],
+            "localPortNumber": [str(local_port)],
+        }
+        _start_session(
+            [
+                "--target",
+                instance_id,
+                "--document-name",
+                document_name,
+                "--parameters",
+                json.dumps(parameters),
+            ]
         )
     else:
-        os.system(f"aws ssm start-session --target {instance_id}")
+        _start_session(["--target", instance_id])
+
 
+def _start_session(args: List[str]) -> None:
+    """
+    Run ``aws ssm start-session`` with *args* in the foreground.
+
+    The argv list is passed without a shell, so instance ids and hosts are
+    never re-parsed. Like ``os.system``, Ctrl-C is swallowed here while the
+    session runs so it only ends the session, not cloudutil. A no-op handler
+    is used rather than SIG_IGN, which the child would inherit across exec.
+    """
+    previous = signal.signal(signal.SIGINT, lambda signum, frame: None)
+    try:
+        subprocess.run(["aws", "ssm", "start-session", *args], check=False)
+    except FileNotFoundError:
+        console.print(
+            "[bold red][!] ERROR: aws CLI not found. Please install it.[/bold red]"
+        )
+    finally:
+        signal.signal(signal.SIGINT, previous)
+
+
+class Instance(NamedTuple):
+    """EC2 instance reachable through SSM."""
 
-def list_ssm_instances() -> List[dict[str, str]]:
-    ec2 = get_aws_client("ec2")
-    response = ec2.describe_instances(Filters=[{"Name": "tag:Name", "Values": ["*"]}])
+    instance_id: str
+    name: str
+
+
+def list_ssm_instances() -> List[Instance]:
+    """
+    List running, named EC2 instances that have an IAM instance profile.
+
+    All three conditions are server-side filters, and DescribeInstances is
+    paginated so large accounts are not truncated to the first page.
+    """
+    ec2 = get_aws_client("ec2", config=tuned_client_config())
+    paginator = ec2.get_paginator("describe_instances")
+    pages = paginator.paginate(
+        Filters=[
+            {"Name": "tag:Name", "Values": ["*"]},
+            {"Name": "iam-instance-profile.arn", "Values": ["*"]},
+            {"Name": "instance-state-name", "Values": ["running"]},
+        ],
+        PaginationConfig={"PageSize": 100},
+    )
     instances = []
-    for reservation in response["Reservations"]:
-        for instance in reservation["Instances"]:
-            if "IamInstanceProfile" not in instance:
-                continue
-            name = ""
-            for tag in instance.get("Tags", []):
-                if tag["Key"] == "Name":
-                    name = tag["Value"]
-                    break
-            instances.append({"instance_id": instance["InstanceId"], "name": name})
+    for page in pages:
+        for reservation in page["Reservations"]:
+            for instance in reservation["Instances"]:
+                name = next(
+                    (
+                        tag["Value"]
+                        for tag in instance.get("Tags", [])
+                        if tag["Key"] == "Name"
+                    ),
+                    "",
+                )
+                instances.append(Instance(instance["InstanceId"], name))
     return instances
 
 
 # ── FzfView subclass for EC2 instance selection ───────────────────────────────
 
 
-class EC2InstanceView(FzfView[dict]):
+class EC2InstanceView(FzfView[Instance]):
     """
     Interactive fzf viewer for EC2 instances reachable via SSM.
 
@@ -179,15 +358,23 @@ class EC2InstanceView(FzfView[dict]):
         self._remote_port = remote_port
         self._local_port = local_port
 
-    def list_items(self) -> List[dict]:
+    def list_items(self) -> List[Instance]:
         return list_ssm_instances()
 
-    def item_label(self, item: dict) -> str:
-        return f"{item['instance_id']} | {item['name']}"
+    def item_label(self, item: Instance) -> str:
+        return f"{item.instance_id} | {item.name}"
+
+    def resolve_selection(
+        self, label: str, items: List[Instance]
+    ) -> Optional[Instance]:
+        # Instance ids never contain the delimiter, so the id is everything
+        # before the first one, whatever the name holds.
+        instance_id = label.partition(" | ")[0]
+        return next((i for i in items if i.instance_id == instance_id), None)
 
-    def display_item(self, item: dict) -> None:
+    def display_item(self, item: Instance) -> None:
         ssm_instance(
-            instance_id=item["instance_id"],
+            instance_id=item.instance_id,
             tunnel=self._tunnel,
             remote_host=self._remote_host,
             remote_port=self._remote_port,
@@ -202,6 +389,7 @@ def search_parameters_with_fzf(
     prefix: str = "/",
     profile_name: Optional[str] = None,
     region_name: Optional[str] = None,
+    use_cache: bool = True,
 ) -> None:
     """
     Search SSM parameters using fzf for interactive selection.
@@ -213,4 +401,5 @@ def search_parameters_with_fzf(
         prefix=prefix,
         profile_name=profile_name,
         region_name=region_name,
+        use_cache=use_cache,
     ).run()
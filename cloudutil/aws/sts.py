@@ -1,9 +1,24 @@
-from .common import get_aws_client
+from functools import lru_cache
+from typing import Optional
+
+from .common import get_aws_client, tuned_client_config
+
+
+@lru_cache(maxsize=32)
+def get_sts_client(
+    profile_name: Optional[str] = None, region_name: Optional[str] = None
+):
+    """
+    Get STS client with optional profile and region.
+
+    Clients are cached per ``(profile_name, region_name)`` so the credential
+    provider chain is resolved once per process instead of once per call.
+    """
+    return get_aws_client("sts", profile_name, region_name, tuned_client_config())
 
 
 def decode_authorization_failure_message(encoded_message: str):
-    # Initialize a Boto3 client for IAM
-    client = get_aws_client("sts")
+    client = get_sts_client()
 
     try:
         # Call the decode_authorization_message API
@@ -1,12 +1,23 @@
 """Azure CLI interface."""
 
-import json
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional
 
+import orjson
 import typer
 
-from cloudutil.utils import console
-from .secrets import search_secrets_with_fzf
+from cloudutil.utils import console, stdout_console
+from .secrets import Secret, search_secrets_with_fzf
+
+
+@lru_cache(maxsize=1)
+def _secrets_adapter():
+    """Serialises a whole selection in one pass through pydantic-core."""
+    # Built on first JSON output so other commands do not import pydantic.
+    from pydantic import TypeAdapter
+
+    return TypeAdapter(List[Secret])
+
 
 app = typer.Typer(
     pretty_exceptions_enable=False,
@@ -22,36 +33,50 @@ def secrets(
     output: str = typer.Option(
         "text", "--output", "-o", help="Output format (text/json)"
     ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Ignore cached listings and fetch fresh ones."
+    ),
 ):
     """
     Search Key Vault secrets interactively using fzf for selection.
     """
     try:
         quiet = output.lower() == "json"
-        selected = search_secrets_with_fzf(vault_name=vault, name_filter=name_filter)
+        selected = search_secrets_with_fzf(
+            vault_name=vault, name_filter=name_filter, use_cache=not no_cache
+        )
 
         if not selected:
             raise typer.Exit(code=1)
 
         if quiet:
-            console.print(
-                json.dumps([s.model_dump() for s in selected], indent=2, default=str)
-            )
+            # Plain stdout so the JSON can be piped; rich would re-wrap it.
+            print(_secrets_adapter().dump_json(selected, indent=2).decode())
         else:
+            # Secret fields are user data: build the whole report and print it
+            # once with markup and highlighting off.
+            buf: List[str] = []
             for s in selected:
-                console.print(f"Name: '{s.name}'")
+                buf.append(f"Name: '{s.name}'\n")
                 if s.description:
-                    console.print(f"Description: '{s.description}'")
+                    buf.append(f"Description: '{s.description}'\n")
                 if s.id:
-                    console.print(f"ID: '{s.id}'")
-                try:
-                    parsed = json.loads(s.value)
-                    console.print("Value (JSON):")
-                    console.print(json.dumps(parsed, indent=2))
-                except json.JSONDecodeError:
-                    console.print(f"Value: {s.value}")
-                console.print("-" * 80)
-                console.print()
+                    buf.append(f"ID: '{s.id}'\n")
+                # Only values that look like a JSON object/array are worth a
+                # parse attempt; plain strings go straight to the raw branch.
+                parsed = None
+                if s.value[:1] in ("{", "["):
+                    try:
+                        parsed = orjson.loads(s.value)
+                    except orjson.JSONDecodeError:
+                        pass
+                if parsed is not None:
+                    pretty = orjson.dumps(parsed, option=orjson.OPT_INDENT_2).decode()
+                    buf.append(f"Value (JSON):\n{pretty}\n")
+                else:
+                    buf.append(f"Value: {s.value}\n")
+                buf.append("-" * 80 + "\n\n")
+            stdout_console().print("".join(buf), end="", markup=False, highlight=False)
 
     except typer.Exit:
         raise
@@ -1,17 +1,26 @@
 """Azure Key Vault secrets utilities."""
 
-from typing import List, Optional
+from __future__ import annotations
 
-from azure.identity import DefaultAzureCredential
-from azure.keyvault.secrets import SecretClient
-from pydantic import BaseModel
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
+
+import orjson
+
+if TYPE_CHECKING:
+    from azure.identity import DefaultAzureCredential
+    from azure.keyvault.secrets import SecretClient
 
 from ..helper.fzf_view import FzfView
 
-from ..utils import console
+from ..utils import LIST_CACHE_TTL, cache_get, cache_set, console
 
 
-class Secret(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Secret:
     """Secret model."""
 
     name: str
@@ -20,22 +29,96 @@ class Secret(BaseModel):
     description: Optional[str] = None
 
 
+@lru_cache(maxsize=1)
+def get_credential() -> DefaultAzureCredential:
+    """
+    Get the process-wide Azure credential (probes the chain once).
+
+    Tokens acquired by credentials that go through MSAL (service principal,
+    username/password, interactive) are kept in a persistent token cache,
+    so later invocations reuse them instead of authenticating again. The
+    cache lives in the OS keyring where available and otherwise in a plain
+    file under the user's home directory.
+    """
+    # Azure SDK imports are deferred so other commands do not pay for them.
+    from azure.identity import DefaultAzureCredential, TokenCachePersistenceOptions
+
+    return DefaultAzureCredential(
+        cache_persistence_options=TokenCachePersistenceOptions(
+            name="cloudutil", allow_unencrypted_storage=True
+        )
+    )
+
+
+@lru_cache(maxsize=8)
 def get_secret_client(vault_name: str) -> SecretClient:
-    """Get Key Vault client."""
+    """
+    Get Key Vault client.
+
+    Clients are cached per vault so repeated calls share one credential and
+    one HTTP connection pool.
+    """
+    from azure.keyvault.secrets import SecretClient
+
     vault_url = f"https://{vault_name}.vault.azure.net/"
-    credential = DefaultAzureCredential()
-    return SecretClient(vault_url=vault_url, credential=credential)
+    return SecretClient(vault_url=vault_url, credential=get_credential())
+
+
+def cache_scope() -> List[Optional[str]]:
+    """
+    Return the parts of a cache key that identify the effective Azure identity.
+
+    DefaultAzureCredential tries environment credentials before the Azure
+    CLI, so this keys on AZURE_TENANT_ID/AZURE_CLIENT_ID and on the CLI's
+    active account. The account is read from azureProfile.json so a cache
+    hit does not need the SDK. Switching ``az login`` accounts therefore
+    never reuses another identity's listing.
+    """
+    user = tenant = None
+    config_dir = os.getenv("AZURE_CONFIG_DIR") or Path.home() / ".azure"
+    try:
+        # The CLI writes this file with a UTF-8 BOM.
+        raw = (Path(config_dir) / "azureProfile.json").read_bytes()
+        profile = orjson.loads(raw.removeprefix(b"\xef\xbb\xbf"))
+        account = next(
+            (sub for sub in profile.get("subscriptions", []) if sub.get("isDefault")),
+            None,
+        )
+        if account:
+            user = account.get("user", {}).get("name")
+            tenant = account.get("tenantId")
+    except (OSError, orjson.JSONDecodeError):
+        pass
+    return [os.getenv("AZURE_TENANT_ID"), os.getenv("AZURE_CLIENT_ID"), user, tenant]
 
 
-def list_secrets(vault_name: str, name_filter: Optional[str] = None) -> List[str]:
-    """List Key Vault secret names."""
+def list_secrets(
+    vault_name: str, name_filter: Optional[str] = None, use_cache: bool = True
+) -> List[str]:
+    """
+    List Key Vault secret names.
+
+    Key Vault has no server-side name filter and each page is chained to the
+    previous one by a continuation token, so pages are walked in order and
+    filtered as they arrive rather than collected first. With *use_cache*, a
+    listing from the last ``LIST_CACHE_TTL`` seconds is reused.
+    """
+    cache_key = ["keyvault-list", vault_name, name_filter, *cache_scope()]
+    if use_cache:
+        cached = cache_get("listings", cache_key)
+        if cached is not None:
+            return cached
+
     client = get_secret_client(vault_name)
-    secrets = []
-    for secret_prop in client.list_properties_of_secrets():
-        if name_filter and not secret_prop.name.startswith(name_filter):
-            continue
-        secrets.append(secret_prop.name)
-    return secrets
+    pages = client.list_properties_of_secrets().by_page()
+    names = [
+        secret_prop.name
+        for page in pages
+        for secret_prop in page
+        if not name_filter or secret_prop.name.startswith(name_filter)
+    ]
+    cache_set("listings", cache_key, names, ttl=LIST_CACHE_TTL)
+    return names
 
 
 def get_secret(vault_name: str, name: str) -> Secret:
@@ -57,20 +140,24 @@ class AzureSecretsView(FzfView[str]):
     """
     Interactive fzf viewer for Azure Key Vault secrets.
 
-    Lists secret names, lets the user pick via fzf, then fetches and
-    returns the selected ``Secret`` objects.
+    Lists secret names, lets the user pick via fzf, then fetches the
+    selected ``Secret`` objects. Nothing is printed for the selection; the
+    CLI renders it as text or JSON.
     """
 
     item_type_name = "Azure Key Vault secret"
     multi_select = True
+    max_workers = 16
 
     def __init__(
         self,
         vault_name: str,
         name_filter: Optional[str] = None,
+        use_cache: bool = True,
     ) -> None:
         self._vault_name = vault_name
         self._name_filter = name_filter
+        self._use_cache = use_cache
         self._selected_secrets: List[Secret] = []
 
     def list_items(self) -> List[str]:
@@ -82,15 +169,24 @@ class AzureSecretsView(FzfView[str]):
                 else ""
             )
         )
-        return list_secrets(self._vault_name, self._name_filter)
+        return list_secrets(self._vault_name, self._name_filter, self._use_cache)
 
     def item_label(self, item: str) -> str:
         return item
 
-    def display_item(self, item: str) -> dict[str, str]:
-        secret = get_secret(self._vault_name, item)
-        self._selected_secrets.append(secret)
-        return {secret.name: secret.value}
+    def display_item(self, item: str) -> dict[str, Secret]:
+        return {item: get_secret(self._vault_name, item)}
+
+    def display_selection(self, items: List[str]) -> None:
+        # A cached listing skips get_secret_client, so build the client (and
+        # its credential) here: lru_cache would let every worker miss at once.
+        get_secret_client(self._vault_name)
+        # _display_items keeps selection order even when fetching concurrently.
+        self._selected_secrets = [
+            secret
+            for result in self._display_items(items)
+            for secret in result.values()
+        ]
 
 
 # ── Convenience function (backwards-compatible) ───────────────────────────────
@@ -99,6 +195,7 @@ class AzureSecretsView(FzfView[str]):
 def search_secrets_with_fzf(
     vault_name: str,
     name_filter: Optional[str] = None,
+    use_cache: bool = True,
 ) -> List[Secret]:
     """
     Search Key Vault secrets using fzf for interactive selection.
@@ -106,5 +203,8 @@ def search_secrets_with_fzf(
     Returns:
         List of selected Secret objects.
     """
-    view = AzureSecretsView(vault_name=vault_name, name_filter=name_filter)
+    view = AzureSecretsView(
+        vault_name=vault_name, name_filter=name_filter, use_cache=use_cache
+    )
     view.run()
+    return view._selected_secrets
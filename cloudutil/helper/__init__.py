@@ -1,6 +1,7 @@
 """cloudutil.helper — shared utilities re-exported for convenience."""
 
 from cloudutil.helper.fzf_view import FzfView
+from cloudutil.helper.fzf_view import fzf_executable as _fzf_executable
 
 # Re-export the legacy helpers that existing modules import from cloudutil.helper
 # so nothing breaks while callers are migrated to the new package layout.
@@ -32,11 +33,26 @@ def fzf_select(
             f"[*] Found {len(items)} {service_name}s. Opening fzf for selection..."
         )
 
-    fzf_cmd = ["fzf", "-e"]
+    executable = _fzf_executable()
+    if executable is None:
+        _console.print(
+            f"[bold red][!] ERROR: fzf not found. Please install fzf for "
+            f"interactive {service_name} selection.[/bold red]"
+        )
+        return []
+
+    # NUL-separated framing so items containing newlines survive the round-trip.
+    fzf_cmd = [executable, "-e", "--read0", "--print0"]
     if multi_select:
         fzf_cmd.append("-m")
 
-    success, stdout, stderr = _shell.run_command(fzf_cmd, input_text="\n".join(items))
+    # Work in bytes end to end: encode once on the way in and decode only the
+    # items the user actually selected on the way out.
+    success, stdout, stderr = _shell.run_command(
+        fzf_cmd, input_text=b"\0".join(item.encode() for item in items), text=False
+    )
+    if isinstance(stderr, bytes):
+        stderr = stderr.decode(errors="replace")
 
     if not success:
         if "Command not found" in stderr and "fzf" in stderr:
@@ -50,7 +66,7 @@ def fzf_select(
             )
         return []
 
-    selected = stdout.strip().splitlines()
+    selected = [item.decode() for item in stdout.split(b"\0") if item]
 
     if not selected:
         if not quiet:
@@ -2,38 +2,78 @@
 
 from __future__ import annotations
 
-import json
+import shutil
 import sys
 import subprocess
 from abc import ABC, abstractmethod
-from typing import Generic, List, Optional, TypeVar
-from cloudutil.utils import console
-from rich.console import Console
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Generic, Iterable, Iterator, List, Optional, TypeVar
+
+import orjson
+
+from cloudutil.utils import console, stdout_console
 
 # T is the domain object produced by list_items() and consumed by display_item().
 T = TypeVar("T")
 
 
-def _run_fzf(items: List[str], multi_select: bool = True) -> List[str]:
+@lru_cache(maxsize=1)
+def fzf_executable() -> Optional[str]:
+    """
+    Return the fzf binary to launch, or None if none is available.
+
+    Prefers ``fzf`` on PATH and falls back to the copy bundled with the
+    optional ``iterfzf`` package (``pip install cloudutil[fzf]``).
+    """
+    found = shutil.which("fzf")
+    if found:
+        return found
+    try:
+        from iterfzf import BUNDLED_EXECUTABLE
+    except ImportError:
+        return None
+    if BUNDLED_EXECUTABLE is not None and BUNDLED_EXECUTABLE.exists():
+        return str(BUNDLED_EXECUTABLE)
+    return None
+
+
+def _run_fzf(
+    items: Iterable[str], multi_select: bool = True, exit_if_empty: bool = False
+) -> List[str]:
     """
     Pipe *items* into fzf and return the user's selection(s).
 
+    Items are written to fzf's stdin as they are produced, so a generator
+    backed by a paginated API lets fzf start filtering on the first page
+    while later pages are still loading. Set *exit_if_empty* when the caller
+    cannot know up front whether *items* is empty.
+
     Returns an empty list when the user cancels or fzf is not installed.
     """
-    if not items:
+    executable = fzf_executable()
+    if executable is None:
+        console.print(
+            "[bold red][!] ERROR: fzf not found. Please install fzf.[/bold red]"
+        )
         return []
 
-    fzf_cmd = ["fzf", "-e"]
+    # NUL-separated framing so labels containing newlines survive the round-trip.
+    fzf_cmd = [executable, "-e", "--read0", "--print0"]
     if multi_select:
         fzf_cmd.append("-m")
+    if exit_if_empty:
+        fzf_cmd.append("--exit-0")
 
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             fzf_cmd,
-            input="\n".join(items),
-            capture_output=True,
-            text=True,
-            check=False,
+            # Unbuffered so each label reaches fzf as soon as it is produced
+            # and a closed pipe is noticed before the next page is fetched.
+            bufsize=0,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
         )
     except FileNotFoundError:
         console.print(
@@ -41,16 +81,32 @@ def _run_fzf(items: List[str], multi_select: bool = True) -> List[str]:
         )
         return []
 
-    if result.returncode not in (0, 1):
+    try:
+        for item in items:
+            proc.stdin.write(item.encode() + b"\0")
+        proc.stdin.close()
+    except BrokenPipeError:
+        # fzf exited (selection made or cancelled) before all input was sent.
+        pass
+    except BaseException:
+        proc.kill()
+        proc.wait()
+        raise
+
+    stdout = proc.stdout.read()
+    stderr = proc.stderr.read()
+    returncode = proc.wait()
+
+    if returncode not in (0, 1):
         # returncode 1 means no match / cancelled — that is fine; anything else is an error.
         console.print(
-            f"[bold red][!] ERROR: fzf exited with code {result.returncode}: "
-            f"{result.stderr.strip()}[/bold red]"
+            f"[bold red][!] ERROR: fzf exited with code {returncode}: "
+            f"{stderr.decode(errors='replace').strip()}[/bold red]"
         )
         return []
 
-    selected = result.stdout.strip().splitlines()
-    return [line for line in selected if line]
+    # Decode only the selected items rather than the whole output buffer.
+    return [item.decode() for item in stdout.split(b"\0") if item]
 
 
 class FzfView(ABC, Generic[T]):
@@ -65,6 +121,10 @@ class FzfView(ABC, Generic[T]):
 
     Then call ``run()`` to execute the full workflow.
 
+    Views backed by slow, paginated listings can set ``stream_items = True``
+    and override ``iter_items()``; fzf then opens immediately and receives
+    items as they are fetched.
+
     Example subclass::
 
         class MyView(FzfView[MyThing]):
@@ -81,11 +141,23 @@ class FzfView(ABC, Generic[T]):
     # Human-readable name used in status/error messages.
     item_type_name: str = "item"
 
+    # Threads used to run display_item() over a selection. Keep at 1 for views
+    # whose display_item() is interactive; raise it for independent API reads.
+    max_workers: int = 1
+
+    # Feed fzf from iter_items() as items arrive instead of listing them all
+    # first. Selections are resolved by label, so labels must be unique.
+    stream_items: bool = False
+
     @abstractmethod
     def list_items(self) -> List[T]:
         """Return all available domain objects to present in fzf."""
         pass
 
+    def iter_items(self) -> Iterator[T]:
+        """Yield domain objects for fzf; used when ``stream_items`` is set."""
+        yield from self.list_items()
+
     @abstractmethod
     def item_label(self, item: T) -> str:
         """Return the fzf display string for a single domain object."""
@@ -99,10 +171,37 @@ class FzfView(ABC, Generic[T]):
     def display_selection(self, items: List[T]) -> None:
         """Render selected domain objects as a single JSON payload."""
         payload: dict[str, str] = {}
-        for item in items:
-            payload.update(self.display_item(item))
+        for result in self._display_items(items):
+            payload.update(result)
         self.print_json(payload)
 
+    def _display_items(self, items: List[T]) -> List[dict[str, str]]:
+        """
+        Run ``display_item`` over *items*, concurrently when ``max_workers > 1``.
+
+        Results keep selection order. In concurrent mode a failing item is
+        reported and skipped so one bad fetch does not discard the others.
+        """
+        if self.max_workers <= 1 or len(items) <= 1:
+            return [self.display_item(item) for item in items]
+
+        results: List[Optional[dict[str, str]]] = [None] * len(items)
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as ex:
+            futures = {
+                ex.submit(self.display_item, item): idx
+                for idx, item in enumerate(items)
+            }
+            for future in as_completed(futures):
+                idx = futures[future]
+                try:
+                    results[idx] = future.result()
+                except Exception as e:
+                    console.print(
+                        f"[yellow][!] Could not fetch {self.item_label(items[idx])!r}: "
+                        f"{e}[/yellow]"
+                    )
+        return [result for result in results if result is not None]
+
     # ── Optional hooks ────────────────────────────────────────────────────────
 
     def before_fzf(self, items: List[T]) -> None:
@@ -112,6 +211,9 @@ class FzfView(ABC, Generic[T]):
             "Opening fzf for selection..."
         )
 
+    def before_stream(self) -> None:
+        """Called before fzf starts on a streamed listing. Print status here."""
+
     def resolve_selection(self, label: str, items: List[T]) -> Optional[T]:
         """
         Map a fzf-selected label string back to a domain object.
@@ -125,10 +227,13 @@ class FzfView(ABC, Generic[T]):
         return None
 
     def print_json(self, payload: object) -> None:
-        raw = json.dumps(payload, default=str)
+        # One orjson pass over the whole selection; str() covers anything it
+        # cannot serialise natively, as json.dumps(default=str) did.
+        raw = orjson.dumps(
+            payload, default=str, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
         if sys.stdout.isatty():
-            console_out = Console()  # stdout, not stderr
-            console_out.print_json(raw)
+            stdout_console().print_json(raw)
         else:
             print(raw)
 
@@ -136,6 +241,10 @@ class FzfView(ABC, Generic[T]):
 
     def run(self) -> None:
         """Execute the full list → fzf → display workflow."""
+        if self.stream_items:
+            self._run_streaming()
+            return
+
         items = self.list_items()
 
         if not items:
@@ -144,7 +253,7 @@ class FzfView(ABC, Generic[T]):
 
         self.before_fzf(items)
 
-        labels = [self.item_label(item) for item in items]
+        labels = (self.item_label(item) for item in items)
         selected_labels = _run_fzf(labels, multi_select=self.multi_select)
 
         if not selected_labels:
@@ -162,3 +271,37 @@ class FzfView(ABC, Generic[T]):
             selected_items.append(resolved)
 
         self.display_selection(selected_items)
+
+    def _run_streaming(self) -> None:
+        """Variant of ``run()`` that pipes ``iter_items()`` into fzf lazily."""
+        by_label: dict[str, T] = {}
+
+        def labels() -> Iterator[str]:
+            for item in self.iter_items():
+                label = self.item_label(item)
+                by_label[label] = item
+                yield label
+
+        self.before_stream()
+        console.print(f"[*] Opening fzf for {self.item_type_name} selection...")
+        selected_labels = _run_fzf(
+            labels(), multi_select=self.multi_select, exit_if_empty=True
+        )
+
+        if not by_label:
+            console.print(f"[yellow][!] No {self.item_type_name}s found.[/yellow]")
+            return
+        if not selected_labels:
+            console.print("[yellow][!] No selection made.[/yellow]")
+            return
+
+        selected_items = []
+        for label in selected_labels:
+            if label not in by_label:
+                console.print(
+                    f"[yellow][!] Could not resolve selection: {label!r}[/yellow]"
+                )
+                continue
+            selected_items.append(by_label[label])
+
+        self.display_selection(selected_items)
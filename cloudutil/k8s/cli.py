@@ -9,8 +9,6 @@ import typer
 
 from cloudutil.helper import fzf_select
 from cloudutil.k8s.util import _list_kube_contexts
-from cloudutil.k8s.configmap import view_configmaps_with_fzf
-from cloudutil.k8s.secrets import view_secrets_with_fzf
 from cloudutil.utils import console
 
 app = typer.Typer(
@@ -42,6 +40,9 @@ def k8s_secrets(
     """
     Interactive fzf view for Kubernetes secrets (decodes base64 data before printing).
     """
+    # The view modules import pydantic; load them only for these commands.
+    from cloudutil.k8s.secrets import view_secrets_with_fzf
+
     if all_namespaces:
         namespace = None
     view_secrets_with_fzf(
@@ -74,6 +75,8 @@ def k8s_configmaps(
     """
     Interactive fzf view for Kubernetes ConfigMaps.
     """
+    from cloudutil.k8s.configmap import view_configmaps_with_fzf
+
     if all_namespaces:
         namespace = None
     view_configmaps_with_fzf(
@@ -8,12 +8,6 @@ import os
 import typer
 from rich.rule import Rule
 from cloudutil.utils import console
-from cloudutil.os_utils.yaml_diff import (
-    DiffCheckConfig,
-    compare_pair,
-    extract,
-    load_yaml,
-)
 
 app = typer.Typer(
     name="yaml-diffcheck",
@@ -59,6 +53,14 @@ def ydiff(
     Reads a config YAML and compares all alias pairs, reporting missing keys
     and value differences.
     """
+    # yaml_diff pulls in yaml, jmespath and pydantic; only this command needs them.
+    from cloudutil.os_utils.yaml_diff import (
+        DiffCheckConfig,
+        compare_pair,
+        extract,
+        load_yaml,
+    )
+
     cfg = DiffCheckConfig.from_yaml(config)
     total_pairs = sum(len(e.pairs()) for e in cfg.checks)
 
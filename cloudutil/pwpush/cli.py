@@ -19,7 +19,6 @@ import subprocess
 from pathlib import Path
 import secrets
 import string
-import requests
 import typer
 import rich
 from rich.table import Table
@@ -74,6 +73,9 @@ def config(
 @app.command()
 def list_active():
     """List active passwords."""
+    # requests is only needed by the commands that talk to the server.
+    import requests
+
     config = load_config()
     url = f"{config['source']}/p/active.json"
     headers = {
@@ -117,6 +119,8 @@ def send(
     ),
 ):
     """Send a password push, auto-selecting Bearer or legacy auth based on config."""
+    import requests
+
     config = load_config()
     retrievable_by_viewer = True
     # Prepare payload in temp file
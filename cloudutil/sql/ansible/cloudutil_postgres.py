@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import traceback
 from collections import Counter
+from dataclasses import asdict
 from typing import Any
 
 from ansible.module_utils.basic import AnsibleModule
@@ -125,7 +126,9 @@ def main() -> None:
     except Exception:
         module.fail_json(msg=traceback.format_exc())
 
-    changes = [c.model_dump(exclude_none=True) for c in provider.changes]
+    changes = [
+        {k: v for k, v in asdict(c).items() if v is not None} for c in provider.changes
+    ]
     counts = Counter(c["operation"] for c in changes)
 
     module.exit_json(
@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from cloudutil.sql.modules.base import SQLConfig
-from cloudutil.sql.modules.postgres import PostgreSQLBuilder
+from cloudutil.sql.modules.postgres import PostgreSQLBuilder, load_yaml_file
 
 
 def _resolve_path(config_path: str | Path) -> Path:
@@ -32,13 +31,18 @@ def apply_postgres_config(config_path: str | Path) -> tuple[bool, list[dict[str,
     changed = any(
         c.operation in ("create", "update", "execute") for c in provider.changes
     )
-    return changed, [c.model_dump() for c in provider.changes]
+    return changed, [asdict(c) for c in provider.changes]
+
 
+def validate_postgres_config(config_path: str | Path) -> SQLConfig:
+    """
+    Parse and validate a config file without connecting to the database.
 
-def validate_postgres_config(config_path: str | Path) -> None:
-    """Parse and validate a config file without connecting to the database."""
+    Returns:
+        The validated configuration.
+    """
     path = _resolve_path(config_path)
-    data = yaml.safe_load(path.read_text())
+    data = load_yaml_file(path)
     if not isinstance(data, dict):
         raise ValueError(f"YAML file is empty or not a mapping: {path}")
-    SQLConfig(**data)
+    return SQLConfig(**data)
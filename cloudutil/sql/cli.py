@@ -1,12 +1,11 @@
 """CLI interface for SQL operations."""
 
+from collections import Counter
 from pathlib import Path
 
 import typer
-from pydantic import ValidationError
 from rich import print
 
-from cloudutil.sql.apply import apply_postgres_config, validate_postgres_config
 from cloudutil.utils import logger
 
 app = typer.Typer(
@@ -16,6 +15,53 @@ app = typer.Typer(
 
 SUPPORTED_PROVIDERS = ("postgres",)
 
+# Written verbatim by `cu sql init`; kept as bytes so nothing is encoded per call.
+_CONFIG_TEMPLATE = b"""\
+# SQL Database Configuration
+# Use ${ENV_VAR} syntax for sensitive values
+
+provider:
+  name: postgres
+  version: 17
+  host: localhost          # or ${DB_HOST}
+  port: 5432
+  username: postgres       # or ${POSTGRES_USER}
+  password: changeme       # or ${POSTGRES_PASSWORD}
+  cert: null               # optional: path to SSL root cert
+  ssl_mode: null           # optional: disable|allow|prefer|require|verify-ca|verify-full
+
+database:
+  - name: myapp
+    create: true
+    extensions:
+      - name: uuid-ossp
+      - name: pgcrypto
+
+users:
+  - name: app_readwrite
+    password: ${APP_RW_PASSWORD}
+    privileges:
+      - db: myapp
+        db_schema: public
+        readwrite: true
+        tables: [ALL]
+
+  - name: app_readonly
+    password: ${APP_RO_PASSWORD}
+    privileges:
+      - db: myapp
+        db_schema: public
+        readonly: true
+        tables:
+          - users
+          - sessions
+
+# custom_sql:
+#   - name: seed
+#     database: myapp
+#     query: "INSERT INTO settings (key, value) VALUES ('init', 'true') ON CONFLICT DO NOTHING"
+"""
+
 
 def _require_postgres(provider: str) -> None:
     if provider.lower() not in SUPPORTED_PROVIDERS:
@@ -45,20 +91,21 @@ def execute_config(
     Example:
         cu sql execute -c config.yaml
     """
+    # Deferred so 'init' and --help never load psycopg2 or the YAML loader.
+    from cloudutil.sql.apply import apply_postgres_config
+
     try:
         print(f"[bold blue]Loading configuration from:[/bold blue] {config_file}")
 
         changed, changes = apply_postgres_config(config_path=config_file)
 
-        creates = sum(1 for c in changes if c["operation"] == "create")
-        updates = sum(1 for c in changes if c["operation"] == "update")
-        skips = sum(1 for c in changes if c["operation"] == "skip")
-        executes = sum(1 for c in changes if c["operation"] == "execute")
+        counts = Counter(c["operation"] for c in changes)
 
         print("[bold green]✓ Configuration executed successfully![/bold green]")
         print(
-            f"  Total: {len(changes)} | Created: {creates} | Updated: {updates} | "
-            f"Skipped: {skips} | Executed: {executes}"
+            f"  Total: {len(changes)} | Created: {counts['create']} | "
+            f"Updated: {counts['update']} | Skipped: {counts['skip']} | "
+            f"Executed: {counts['execute']}"
         )
         if not changed:
             print("[dim]  No changes — resources already in desired state.[/dim]")
@@ -66,7 +113,9 @@ def execute_config(
     except FileNotFoundError as e:
         print(f"[bold red]Error:[/bold red] {e}")
         raise typer.Exit(1)
-    except (ValueError, ValidationError) as e:
+    except ValueError as e:
+        # Also catches pydantic's ValidationError, a ValueError subclass, so
+        # pydantic is not imported at CLI startup.
         print(f"[bold red]Configuration Error:[/bold red] {e}")
         raise typer.Exit(1)
     except Exception as e:
@@ -92,14 +141,11 @@ def validate_config(
     Example:
         cu sql validate config.yaml
     """
+    from cloudutil.sql.apply import validate_postgres_config
+
     try:
         print(f"[bold blue]Validating:[/bold blue] {config_file}")
-        validate_postgres_config(config_path=config_file)
-
-        # Re-build for display only (no connection made)
-        from cloudutil.sql.modules.postgres import PostgreSQLBuilder
-
-        cfg = PostgreSQLBuilder().from_yaml(config_file).build().config
+        cfg = validate_postgres_config(config_path=config_file)
 
         print("[bold green]✓ Configuration is valid![/bold green]\n")
 
@@ -130,10 +176,10 @@ def validate_config(
                         access = "READ-ONLY"
                     case _:
                         access = "NONE"
-                tables = "ALL" if "ALL" in priv.tables else f"{len(priv.tables)} tables"
+                tables = "ALL" if priv.grant_all else f"{len(priv.tables)} tables"
                 print(f"    - {priv.db}.{priv.db_schema}: {access} on {tables}")
 
-    except (FileNotFoundError, ValueError, ValidationError) as e:
+    except (FileNotFoundError, ValueError) as e:
         print(f"[bold red]Validation Error:[/bold red] {e}")
         raise typer.Exit(1)
     except Exception as e:
@@ -162,51 +208,7 @@ def init_config(
             print("[yellow]Operation cancelled[/yellow]")
             raise typer.Exit(0)
 
-    output.write_text("""\
-# SQL Database Configuration
-# Use ${ENV_VAR} syntax for sensitive values
-
-provider:
-  name: postgres
-  version: 17
-  host: localhost          # or ${DB_HOST}
-  port: 5432
-  username: postgres       # or ${POSTGRES_USER}
-  password: changeme       # or ${POSTGRES_PASSWORD}
-  cert: null               # optional: path to SSL root cert
-  ssl_mode: null           # optional: disable|allow|prefer|require|verify-ca|verify-full
-
-database:
-  - name: myapp
-    create: true
-    extensions:
-      - name: uuid-ossp
-      - name: pgcrypto
-
-users:
-  - name: app_readwrite
-    password: ${APP_RW_PASSWORD}
-    privileges:
-      - db: myapp
-        db_schema: public
-        readwrite: true
-        tables: [ALL]
-
-  - name: app_readonly
-    password: ${APP_RO_PASSWORD}
-    privileges:
-      - db: myapp
-        db_schema: public
-        readonly: true
-        tables:
-          - users
-          - sessions
-
-# custom_sql:
-#   - name: seed
-#     database: myapp
-#     query: "INSERT INTO settings (key, value) VALUES ('init', 'true') ON CONFLICT DO NOTHING"
-""")
+    output.write_bytes(_CONFIG_TEMPLATE)
 
     print(f"[bold green]✓ Created:[/bold green] {output}")
     print(f"\n  1. Edit {output}")
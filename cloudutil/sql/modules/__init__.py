@@ -10,7 +10,19 @@ from .base import (
     PrivilegeConfig,
     CustomSQLQuery,
 )
-from .postgres import PostgreSQLProvider, PostgreSQLBuilder
+
+# Resolved on first access (PEP 562) so importing the config models does not
+# pull in psycopg2 and yaml through the postgres module.
+_LAZY_POSTGRES = ("PostgreSQLProvider", "PostgreSQLBuilder")
+
+
+def __getattr__(name: str):
+    if name in _LAZY_POSTGRES:
+        from . import postgres
+
+        return getattr(postgres, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "BaseSQLProvider",
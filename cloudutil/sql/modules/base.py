@@ -4,7 +4,7 @@ from pathlib import Path
 from typing import Any
 
 from jinja2 import Environment, FileSystemLoader
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 
 from cloudutil.utils import resolve_env_variable
 
@@ -75,14 +75,22 @@ class PrivilegeConfig(BaseModel):
     readonly: bool = False
     tables: list[str] = Field(default_factory=list)
 
+    _grant_all: bool = PrivateAttr(default=False)
+
     @model_validator(mode="after")
     def validate_access_flags(self) -> "PrivilegeConfig":
         if self.readwrite and self.readonly:
             raise ValueError(
                 f"privilege for db '{self.db}': readwrite and readonly cannot both be true"
             )
+        self._grant_all = "ALL" in self.tables
         return self
 
+    @property
+    def grant_all(self) -> bool:
+        """True when ``tables`` contains ``ALL`` (computed once at validation)."""
+        return self._grant_all
+
 
 class UserConfig(BaseModel):
     """User configuration"""
@@ -160,18 +168,42 @@ class SQLConfig(BaseModel):
     """Complete SQL configuration schema"""
 
     provider: ProviderConfig
-    database: list[DatabaseConfig] | dict[str, DatabaseConfig] = Field(
-        default_factory=list
-    )
+    database: dict[str, DatabaseConfig] = Field(default_factory=dict)
     users: list[UserConfig] = Field(default_factory=list)
     custom_sql: list[CustomSQLQuery] = Field(default_factory=list)
 
+    @field_validator("database", mode="before")
+    @classmethod
+    def key_database_by_name(cls, v: Any) -> Any:
+        """Key the YAML list of databases by name before it is validated."""
+        if not isinstance(v, list):
+            return v
+        return {
+            (db.get("name") if isinstance(db, dict) else getattr(db, "name", None)): db
+            for db in v
+        }
+
+    _dbs_with_extensions: tuple[DatabaseConfig, ...] = PrivateAttr(default=())
+    _users_with_privileges: tuple[UserConfig, ...] = PrivateAttr(default=())
+
     @model_validator(mode="after")
-    def normalize_database(self) -> "SQLConfig":
-        if isinstance(self.database, list):
-            self.database = {db.name: db for db in self.database}
+    def index_work(self) -> "SQLConfig":
+        self._dbs_with_extensions = tuple(
+            db for db in self.database.values() if db.extensions
+        )
+        self._users_with_privileges = tuple(u for u in self.users if u.privileges)
         return self
 
+    @property
+    def dbs_with_extensions(self) -> tuple[DatabaseConfig, ...]:
+        """Databases that list extensions (computed once at validation)."""
+        return self._dbs_with_extensions
+
+    @property
+    def users_with_privileges(self) -> tuple[UserConfig, ...]:
+        """Users that list privileges (computed once at validation)."""
+        return self._users_with_privileges
+
 
 class BaseSQLProvider(ABC):
     """Abstract base class for SQL providers"""
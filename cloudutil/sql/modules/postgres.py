@@ -1,12 +1,15 @@
-from collections import Counter
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Callable, Literal
 
 import psycopg2
 import yaml
 from psycopg2 import sql
-from pydantic import BaseModel
 
 from cloudutil.utils import logger
 from .base import (
@@ -19,8 +22,50 @@ from .base import (
     UserConfig,
 )
 
+# libyaml's C loader when PyYAML was built with it; same semantics as SafeLoader.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Statement templates, built once at import and only .format()-ed per call.
+_CREATE_DATABASE = sql.SQL("CREATE DATABASE {} OWNER {}")
+_ALTER_DATABASE_OWNER = sql.SQL("ALTER DATABASE {} OWNER TO {}")
+_ALTER_EXTENSION = sql.SQL("ALTER EXTENSION {} UPDATE")
+_CREATE_EXTENSION = sql.SQL("CREATE EXTENSION IF NOT EXISTS {}")
+_ALTER_USER = sql.SQL("ALTER USER {} WITH PASSWORD %s")
+_CREATE_USER = sql.SQL("CREATE USER {} WITH PASSWORD %s")
+_GRANT_CONNECT = sql.SQL("GRANT CONNECT ON DATABASE {} TO {}")
+_GRANT_USAGE = sql.SQL("GRANT USAGE ON SCHEMA {} TO {}")
+_GRANT_CREATE = sql.SQL("GRANT CREATE ON SCHEMA {} TO {}")
+_GRANT_ALL_TABLES = sql.SQL("GRANT {} ON ALL TABLES IN SCHEMA {} TO {}")
+_GRANT_DEFAULT = sql.SQL(
+    "ALTER DEFAULT PRIVILEGES IN SCHEMA {} GRANT {} ON TABLES TO {}"
+)
+_GRANT_TABLES = sql.SQL("GRANT {} ON TABLE {} TO {}")
+_QUALIFIED = sql.SQL("{}.{}")
+_LIST_SEP = sql.SQL(", ")
+_STMT_SEP = sql.SQL("; ")
+_PRIVS_READWRITE = sql.SQL("SELECT, INSERT, UPDATE, DELETE")
+_PRIVS_READONLY = sql.SQL("SELECT")
+
+
+@lru_cache(maxsize=512)
+def _ident(name: str) -> sql.Identifier:
+    """Return a shared ``sql.Identifier`` for *name* (immutable, safe to reuse)."""
+    return sql.Identifier(name)
+
+
+# Section divider in the execution log.
+_RULE = "=" * 60
 
-class ChangeReport(BaseModel):
+# Upper bound on databases worked on concurrently during execute().
+_MAX_WORKERS = 8
+
+
+# Log-line prefix for each ChangeReport operation.
+_OP_TAGS = {op: f"[{op.upper()}]" for op in ("create", "update", "skip", "execute")}
+
+
+@dataclass(slots=True, frozen=True)
+class ChangeReport:
     """Tracks what changed during execution."""
 
     operation: Literal["create", "update", "skip", "execute"]
@@ -29,16 +74,16 @@ class ChangeReport(BaseModel):
     details: dict[str, Any] | None = None
 
     def __str__(self) -> str:
-        base = f"[{self.operation.upper()}] {self.resource_type}: {self.resource_name}"
+        base = f"{_OP_TAGS[self.operation]} {self.resource_type}: {self.resource_name}"
         if not self.details:
             return base
-        parts = []
-        for k, v in self.details.items():
-            if isinstance(v, dict) and "old" in v and "new" in v:
-                parts.append(f"{k}: {v['old']} → {v['new']}")
-            else:
-                parts.append(f"{k}: {v}")
-        return f"{base} ({', '.join(parts)})"
+        parts = ", ".join(
+            f"{k}: {v['old']} → {v['new']}"
+            if isinstance(v, dict) and "old" in v and "new" in v
+            else f"{k}: {v}"
+            for k, v in self.details.items()
+        )
+        return f"{base} ({parts})"
 
 
 class PostgreSQLProvider(BaseSQLProvider):
@@ -47,8 +92,14 @@ class PostgreSQLProvider(BaseSQLProvider):
     def __init__(self, config: SQLConfig):
         super().__init__(config)
         self._conn = None
+        # Connections to databases other than 'postgres', opened on first use
+        # and kept until disconnect() so each database is connected to once.
+        self._db_conns: dict[str, Any] = {}
         self.conn_params: dict = {}
         self.changes: list[ChangeReport] = []
+        # Per-operation totals kept alongside `changes` for the summary.
+        self._op_counts: Counter[str] = Counter()
+        self._changes_lock = threading.Lock()
 
     # =========================================================================
     # CONNECTION
@@ -70,29 +121,33 @@ class PostgreSQLProvider(BaseSQLProvider):
         self._conn = psycopg2.connect(**self.conn_params, database="postgres")
         self._conn.autocommit = True
         logger.info(
-            f"Connected to {self.config.provider.host}:{self.config.provider.port}"
+            "Connected to %s:%s", self.config.provider.host, self.config.provider.port
         )
 
     def disconnect(self) -> None:
+        for conn in self._db_conns.values():
+            conn.close()
+        self._db_conns.clear()
         if self._conn:
             self._conn.close()
             self._conn = None
 
-    @contextmanager
-    def _cursor(self, db: str = "postgres"):
-        """Yield a cursor — reuses main connection for 'postgres', opens a
-        short-lived connection for any other database."""
+    def _get_db_conn(self, db: str):
+        """Return the autocommit connection for *db*, opening it on first use."""
         if db == "postgres":
-            with self._conn.cursor() as cur:
-                yield cur
-        else:
+            return self._conn
+        conn = self._db_conns.get(db)
+        if conn is None or conn.closed:
             conn = psycopg2.connect(**self.conn_params, database=db)
             conn.autocommit = True
-            try:
-                with conn.cursor() as cur:
-                    yield cur
-            finally:
-                conn.close()
+            self._db_conns[db] = conn
+        return conn
+
+    @contextmanager
+    def _cursor(self, db: str = "postgres"):
+        """Yield a cursor on the cached connection for *db*."""
+        with self._get_db_conn(db).cursor() as cur:
+            yield cur
 
     # =========================================================================
     # LOGGING
@@ -111,44 +166,76 @@ class PostgreSQLProvider(BaseSQLProvider):
             resource_name=resource_name,
             details=details,
         )
-        self.changes.append(change)
-        logger.info(str(change))
+        with self._changes_lock:
+            self.changes.append(change)
+            self._op_counts[operation] += 1
+        # Passing the report as an argument defers __str__ until emitted.
+        logger.info("%s", change)
+
+    def _run_per_db(self, tasks: list[Callable[[], None]]) -> None:
+        """
+        Run independent per-database tasks, in threads when there are several.
+
+        Each task must only touch its own database, so no two threads share
+        a connection. The first failure is re-raised once all tasks finish.
+        """
+        if len(tasks) <= 1:
+            for task in tasks:
+                task()
+            return
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(tasks))) as pool:
+            futures = [pool.submit(task) for task in tasks]
+        for future in futures:
+            future.result()
 
     def _section(self, name: str) -> None:
-        logger.info(f"\n{'=' * 60}\n{name}\n{'=' * 60}")
+        logger.info("\n%s\n%s\n%s", _RULE, name, _RULE)
 
     # =========================================================================
     # DATABASE
     # =========================================================================
 
-    def create_database(self, db_config: DatabaseConfig) -> None:
-        if not db_config.create:
-            return
-
+    def _existing_databases(self, names: list[str]) -> dict[str, str]:
+        """Return ``{database: owner}`` for those of *names* that exist, in one query."""
         with self._cursor() as cur:
             cur.execute(
-                "SELECT rolname FROM pg_roles WHERE oid = "
-                "(SELECT datdba FROM pg_database WHERE datname = %s)",
-                (db_config.name,),
+                "SELECT d.datname, r.rolname FROM pg_database d "
+                "JOIN pg_roles r ON r.oid = d.datdba WHERE d.datname = ANY(%s)",
+                (names,),
             )
-            row = cur.fetchone()
+            return dict(cur.fetchall())
+
+    def create_database(
+        self, db_config: DatabaseConfig, existing: dict[str, str] | None = None
+    ) -> None:
+        """
+        Create the database or fix its owner.
+
+        *existing* is a prefetched ``{database: owner}`` map (see
+        ``_existing_databases``); without it the database is looked up here.
+        """
+        if not db_config.create:
+            return
+
+        if existing is None:
+            existing = self._existing_databases([db_config.name])
 
-        match row:
+        match existing.get(db_config.name):
             case None:
                 with self._cursor() as cur:
                     cur.execute(
-                        sql.SQL("CREATE DATABASE {} OWNER {}").format(
-                            sql.Identifier(db_config.name),
-                            sql.Identifier(self.config.provider.username),
+                        _CREATE_DATABASE.format(
+                            _ident(db_config.name),
+                            _ident(self.config.provider.username),
                         )
                     )
                 self._log("create", "database", db_config.name)
-            case (current_owner,) if current_owner != self.config.provider.username:
+            case current_owner if current_owner != self.config.provider.username:
                 with self._cursor() as cur:
                     cur.execute(
-                        sql.SQL("ALTER DATABASE {} OWNER TO {}").format(
-                            sql.Identifier(db_config.name),
-                            sql.Identifier(self.config.provider.username),
+                        _ALTER_DATABASE_OWNER.format(
+                            _ident(db_config.name),
+                            _ident(self.config.provider.username),
                         )
                     )
                 self._log(
@@ -169,110 +256,171 @@ class PostgreSQLProvider(BaseSQLProvider):
     # EXTENSIONS
     # =========================================================================
 
+    def _installed_extensions(self, db_name: str, names: list[str]) -> dict[str, bool]:
+        """
+        Return ``{extension: up_to_date}`` for those of *names* installed in
+        *db_name*, in one query. ``up_to_date`` is true when the installed
+        version is the server's default version.
+        """
+        with self._cursor(db_name) as cur:
+            cur.execute(
+                "SELECT e.extname, e.extversion IS NOT DISTINCT FROM a.default_version "
+                "FROM pg_extension e "
+                "LEFT JOIN pg_available_extensions a ON a.name = e.extname "
+                "WHERE e.extname = ANY(%s)",
+                (names,),
+            )
+            return dict(cur.fetchall())
+
     def install_extensions(
         self, db_name: str, extensions: list[ExtensionConfig]
     ) -> None:
-        for ext in extensions:
+        installed = self._installed_extensions(db_name, [e.name for e in extensions])
+        missing = [ext.name for ext in extensions if ext.name not in installed]
+        if missing:
+            # psycopg2 has no pipeline mode; one multi-statement query creates
+            # every missing extension in a single round-trip.
             with self._cursor(db_name) as cur:
                 cur.execute(
-                    "SELECT 1 FROM pg_extension WHERE extname = %s", (ext.name,)
+                    _STMT_SEP.join(_CREATE_EXTENSION.format(_ident(n)) for n in missing)
                 )
-                if cur.fetchone():
+        for ext in extensions:
+            name = f"{db_name}.{ext.name}"
+            match installed.get(ext.name):
+                case None:
+                    self._log("create", "extension", name)
+                case True:
+                    # Already at the default version: ALTER ... UPDATE is a no-op.
+                    self._log("skip", "extension", name)
+                case _:
                     try:
-                        cur.execute(
-                            sql.SQL("ALTER EXTENSION {} UPDATE").format(
-                                sql.Identifier(ext.name)
-                            )
-                        )
-                        self._log("update", "extension", f"{db_name}.{ext.name}")
+                        with self._cursor(db_name) as cur:
+                            cur.execute(_ALTER_EXTENSION.format(_ident(ext.name)))
+                        self._log("update", "extension", name)
                     except Exception as e:
                         logger.warning(
-                            f"ALTER EXTENSION {ext.name} UPDATE failed, skipping: {e}"
+                            "ALTER EXTENSION %s UPDATE failed, skipping: %s",
+                            ext.name,
+                            e,
                         )
-                        self._log("skip", "extension", f"{db_name}.{ext.name}")
-                else:
-                    cur.execute(
-                        sql.SQL("CREATE EXTENSION IF NOT EXISTS {}").format(
-                            sql.Identifier(ext.name)
-                        )
-                    )
-                    self._log("create", "extension", f"{db_name}.{ext.name}")
+                        self._log("skip", "extension", name)
 
     # =========================================================================
     # USERS
     # =========================================================================
 
-    def create_user(self, user_config: UserConfig) -> None:
+    def _existing_roles(self, names: list[str]) -> set[str]:
+        """Return those of *names* that exist as roles, in one query."""
         with self._cursor() as cur:
             cur.execute(
-                "SELECT 1 FROM pg_roles WHERE rolname = %s", (user_config.name,)
+                "SELECT rolname FROM pg_roles WHERE rolname = ANY(%s)", (names,)
             )
-            exists = cur.fetchone() is not None
-            user_sql = sql.SQL(
-                "ALTER USER {} WITH PASSWORD %s"
-                if exists
-                else "CREATE USER {} WITH PASSWORD %s"
-            ).format(sql.Identifier(user_config.name))
-            cur.execute(user_sql, (user_config.password,))
-
-        op = "update" if exists else "create"
-        details = {"password": {"old": "***", "new": "***"}} if op == "update" else None
-        self._log(op, "user", user_config.name, details)
+            return {name for (name,) in cur.fetchall()}
+
+    def create_user(
+        self, user_config: UserConfig, existing_roles: set[str] | None = None
+    ) -> None:
+        """
+        Create the user or reset its password.
+
+        *existing_roles* is a prefetched set of role names (see
+        ``_existing_roles``); without it the role is looked up here.
+        """
+        self.create_users([user_config], existing_roles)
+
+    def create_users(
+        self, users: list[UserConfig], existing_roles: set[str] | None = None
+    ) -> None:
+        """Create or update every user in *users* with one multi-statement query."""
+        if not users:
+            return
+        if existing_roles is None:
+            existing_roles = self._existing_roles([u.name for u in users])
+        stmts = [
+            (_ALTER_USER if u.name in existing_roles else _CREATE_USER).format(
+                _ident(u.name)
+            )
+            for u in users
+        ]
+        # Passwords stay bound parameters; psycopg2 interpolates them
+        # client-side, so the whole batch goes out as a single query.
+        with self._cursor() as cur:
+            cur.execute(_STMT_SEP.join(stmts), tuple(u.password for u in users))
+
+        for user in users:
+            if user.name in existing_roles:
+                details = {"password": {"old": "***", "new": "***"}}
+                self._log("update", "user", user.name, details)
+            else:
+                self._log("create", "user", user.name)
 
     # =========================================================================
     # PRIVILEGES
     # =========================================================================
 
-    def grant_privileges(self, user_name: str, priv: PrivilegeConfig) -> None:
+    def _grant_statements(
+        self, user_name: str, priv: PrivilegeConfig
+    ) -> tuple[list[sql.Composed], str] | None:
+        """Return ``(statements, access)`` for *priv*, or None when it grants nothing."""
         if not priv.readwrite and not priv.readonly:
-            self._log("skip", "privilege", f"{user_name}@{priv.db}.{priv.db_schema}")
-            return
-        privs = "SELECT, INSERT, UPDATE, DELETE" if priv.readwrite else "SELECT"
+            return None
+        privs = _PRIVS_READWRITE if priv.readwrite else _PRIVS_READONLY
         mode = "READ/WRITE" if priv.readwrite else "READ-ONLY"
-        schema, user = sql.Identifier(priv.db_schema), sql.Identifier(user_name)
-
-        with self._cursor(priv.db) as cur:
-            cur.execute(
-                sql.SQL("GRANT CONNECT ON DATABASE {} TO {}").format(
-                    sql.Identifier(priv.db), user
-                )
-            )
-            cur.execute(sql.SQL("GRANT USAGE ON SCHEMA {} TO {}").format(schema, user))
-            if priv.readwrite:
-                cur.execute(
-                    sql.SQL("GRANT CREATE ON SCHEMA {} TO {}").format(schema, user)
+        schema, user = _ident(priv.db_schema), _ident(user_name)
+
+        stmts = [
+            _GRANT_CONNECT.format(_ident(priv.db), user),
+            _GRANT_USAGE.format(schema, user),
+        ]
+        if priv.readwrite:
+            stmts.append(_GRANT_CREATE.format(schema, user))
+
+        match priv.tables:
+            case []:
+                access = "CONNECT+USAGE only (no table grants)"
+            case _ if priv.grant_all:
+                stmts.append(_GRANT_ALL_TABLES.format(privs, schema, user))
+                stmts.append(_GRANT_DEFAULT.format(schema, privs, user))
+                access = f"{mode} (ALL)"
+            case tables:
+                # GRANT takes a list of objects, so one statement covers
+                # every table instead of one round-trip per table.
+                table_list = _LIST_SEP.join(
+                    _QUALIFIED.format(schema, _ident(table)) for table in tables
                 )
+                stmts.append(_GRANT_TABLES.format(privs, table_list, user))
+                access = f"{mode} ({len(tables)} tables)"
+        return stmts, access
 
-            match priv.tables:
-                case []:
-                    access = "CONNECT+USAGE only (no table grants)"
-                case tables if "ALL" in tables:
-                    cur.execute(
-                        sql.SQL(
-                            f"GRANT {privs} ON ALL TABLES IN SCHEMA {{}} TO {{}}"
-                        ).format(schema, user)
-                    )
-                    cur.execute(
-                        sql.SQL(
-                            f"ALTER DEFAULT PRIVILEGES IN SCHEMA {{}} GRANT {privs} ON TABLES TO {{}}"
-                        ).format(schema, user)
-                    )
-                    access = f"{mode} (ALL)"
-                case tables:
-                    for table in tables:
-                        cur.execute(
-                            sql.SQL(f"GRANT {privs} ON TABLE {{}}.{{}} TO {{}}").format(
-                                schema, sql.Identifier(table), user
-                            )
-                        )
-                    access = f"{mode} ({len(tables)} tables)"
-
-        self._log(
-            "create",
-            "privilege",
-            f"{user_name}@{priv.db}.{priv.db_schema}",
-            {"access": access},
-        )
+    def grant_privileges(self, user_name: str, priv: PrivilegeConfig) -> None:
+        self._grant_all([(user_name, priv)])
+
+    def _grant_all(self, grants: list[tuple[str, PrivilegeConfig]]) -> None:
+        """
+        Apply *grants*, which must all target the same database.
+
+        psycopg2 has no pipeline mode, and identifiers cannot be bound as
+        executemany() parameters; every statement for the database is sent as
+        one multi-statement query instead, costing a single round-trip. The
+        server runs it as one implicit transaction, so the grants apply together.
+        """
+        stmts: list[sql.Composed] = []
+        applied: list[tuple[str, str]] = []
+        for user_name, priv in grants:
+            name = f"{user_name}@{priv.db}.{priv.db_schema}"
+            planned = self._grant_statements(user_name, priv)
+            if planned is None:
+                self._log("skip", "privilege", name)
+                continue
+            stmts.extend(planned[0])
+            applied.append((name, planned[1]))
+
+        if stmts:
+            with self._cursor(grants[0][1].db) as cur:
+                cur.execute(_STMT_SEP.join(stmts))
+
+        for name, access in applied:
+            self._log("create", "privilege", name, {"access": access})
 
     # =========================================================================
     # CUSTOM SQL
@@ -293,38 +441,81 @@ class PostgreSQLProvider(BaseSQLProvider):
     # EXECUTE
     # =========================================================================
 
+    def _existing_state(
+        self, db_names: list[str], role_names: list[str]
+    ) -> tuple[dict[str, str], set[str]]:
+        """
+        Return what ``_existing_databases`` and ``_existing_roles`` would,
+        for *db_names* and *role_names*, in a single catalog query.
+        """
+        with self._cursor() as cur:
+            cur.execute(
+                "SELECT d.datname, r.rolname FROM pg_database d "
+                "JOIN pg_roles r ON r.oid = d.datdba WHERE d.datname = ANY(%s) "
+                "UNION ALL "
+                "SELECT NULL, rolname FROM pg_roles WHERE rolname = ANY(%s)",
+                (db_names, role_names),
+            )
+            databases: dict[str, str] = {}
+            roles: set[str] = set()
+            for datname, rolname in cur.fetchall():
+                if datname is None:
+                    roles.add(rolname)
+                else:
+                    databases[datname] = rolname
+            return databases, roles
+
     def execute(self) -> None:
         self.changes = []
+        self._op_counts = Counter()
         logger.info("Starting PostgreSQL configuration")
 
+        databases = list(self.config.database.values())
+        existing_dbs, existing_roles = self._existing_state(
+            [db.name for db in databases if db.create],
+            [u.name for u in self.config.users],
+        )
+
         self._section("Databases")
-        for db in self.config.database.values():
-            self.create_database(db)
+        for db in databases:
+            self.create_database(db, existing_dbs)
 
         self._section("Extensions")
-        for db in self.config.database.values():
-            if db.extensions:
-                self.install_extensions(db.name, db.extensions)
+        self._run_per_db(
+            [
+                partial(self.install_extensions, db.name, db.extensions)
+                for db in self.config.dbs_with_extensions
+            ]
+        )
 
         self._section("Users")
-        for user in self.config.users:
-            self.create_user(user)
+        self.create_users(self.config.users, existing_roles)
 
         self._section("Privileges")
-        for user in self.config.users:
+        # Group by database so each thread works on one cached connection;
+        # within a database, grants keep their configured order.
+        grants_by_db: dict[str, list[tuple[str, PrivilegeConfig]]] = defaultdict(list)
+        for user in self.config.users_with_privileges:
             for priv in user.privileges:
-                self.grant_privileges(user.name, priv)
+                grants_by_db[priv.db].append((user.name, priv))
+        self._run_per_db(
+            [partial(self._grant_all, grants) for grants in grants_by_db.values()]
+        )
 
         if self.config.custom_sql:
             self._section("Custom SQL")
             for idx, item in enumerate(self.config.custom_sql):
                 self.execute_custom_sql(item, idx)
 
-        counts = Counter(c.operation for c in self.changes)
+        counts = self._op_counts
         self._section("Summary")
         logger.info(
-            f"Total: {len(self.changes)} | Created: {counts['create']} | "
-            f"Updated: {counts['update']} | Skipped: {counts['skip']} | Executed: {counts['execute']}"
+            "Total: %d | Created: %d | Updated: %d | Skipped: %d | Executed: %d",
+            len(self.changes),
+            counts["create"],
+            counts["update"],
+            counts["skip"],
+            counts["execute"],
         )
         logger.info("Complete")
 
@@ -334,6 +525,28 @@ class PostgreSQLProvider(BaseSQLProvider):
 # =============================================================================
 
 
+@lru_cache(maxsize=16)
+def _parse_yaml_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse *path*; ``mtime_ns``/``size`` only key the cache to the file's state."""
+    # Binary stream: the loader reads and decodes it in chunks itself.
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def load_yaml_file(yaml_path: str | Path) -> Any:
+    """
+    Return the parsed YAML document at *yaml_path*.
+
+    Parses are memoized per process on (resolved path, mtime, size), so
+    loading an unchanged file again skips the parse. Only the raw document
+    is cached; ``${VAR}`` references are still resolved at validation time.
+    The returned object is shared — treat it as read-only.
+    """
+    path = Path(yaml_path).resolve()
+    stat = path.stat()
+    return _parse_yaml_file(str(path), stat.st_mtime_ns, stat.st_size)
+
+
 class PostgreSQLBuilder:
     """Fluent builder — load config from dict, YAML file, or YAML string."""
 
@@ -348,14 +561,16 @@ class PostgreSQLBuilder:
         path = Path(yaml_path)
         if not path.exists():
             raise FileNotFoundError(f"YAML file not found: {yaml_path}")
-        with open(path) as f:
-            data = yaml.safe_load(f)
+        data = load_yaml_file(path)
         if not isinstance(data, dict):
             raise ValueError(f"YAML file is empty or not a mapping: {yaml_path}")
+        # Validated on every call: ${VAR} values and custom_sql templates must
+        # reflect the environment at build time, and validated models carry
+        # PrivateAttr state, so they are not shared between builders.
         return self.from_dict(data)
 
     def from_yaml_string(self, yaml_string: str) -> "PostgreSQLBuilder":
-        data = yaml.safe_load(yaml_string)
+        data = yaml.load(yaml_string, Loader=_YamlLoader)
         if not isinstance(data, dict):
             raise ValueError("YAML input is empty or not a mapping")
         return self.from_dict(data)
@@ -1,8 +1,13 @@
+import hashlib
+import json
 import logging
 import os
+import time
+from functools import lru_cache
+from pathlib import Path
 from rich.logging import RichHandler
 import subprocess
-from typing import List, Optional, Tuple
+from typing import Any, List, Optional, Tuple
 from rich.console import Console
 
 
@@ -41,6 +46,12 @@ logger = _logger("LOG_LEVEL")
 console = Console(stderr=True)
 
 
+@lru_cache(maxsize=1)
+def stdout_console() -> Console:
+    """Return the shared stdout console for command output (``console`` is stderr)."""
+    return Console()
+
+
 class ShellRunner:
     """Utility class for running shell commands."""
 
@@ -50,21 +61,22 @@ class ShellRunner:
     def run_command(
         self,
         command: List[str],
-        input_text: Optional[str] = None,
+        input_text: Optional[str | bytes] = None,
         capture_output: bool = True,
         text: bool = True,
-    ) -> Tuple[bool, str, str]:
+    ) -> Tuple[bool, str | bytes, str | bytes]:
         """
         Run a shell command and return success status and output.
 
         Args:
             command: Command to run as list of strings
-            input_text: Input to pass to the command
+            input_text: Input to pass to the command (bytes when ``text`` is False)
             capture_output: Whether to capture stdout/stderr
             text: Whether to treat input/output as text
 
         Returns:
-            Tuple of (success, stdout, stderr)
+            Tuple of (success, stdout, stderr). stdout/stderr are bytes when
+            ``text`` is False, except for the error messages produced here.
         """
         try:
             result = subprocess.run(
@@ -76,8 +88,9 @@ class ShellRunner:
             )
 
             success = result.returncode == 0
-            stdout = result.stdout or ""
-            stderr = result.stderr or ""
+            empty = "" if text else b""
+            stdout = result.stdout or empty
+            stderr = result.stderr or empty
 
             return success, stdout, stderr
 
@@ -115,12 +128,75 @@ def resolve_env_variable(value: str, field_name: str = "field") -> str:
         >>> resolve_env_variable('plaintext')
         'plaintext'
     """
-    if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
-        env_var = value[2:-1]
-        env_value = os.getenv(env_var)
-        if env_value is None:
-            raise ValueError(
-                f"Environment variable '{env_var}' for {field_name} is not set"
-            )
-        return env_value
-    return value
+    # Plain values are the common case; a single character compare rejects
+    # most of them before the full ${...} check.
+    if not isinstance(value, str) or value[:1] != "$":
+        return value
+    if value[1:2] != "{" or value[-1] != "}":
+        return value
+    env_var = value[2:-1]
+    env_value = os.environ.get(env_var)
+    if env_value is None:
+        raise ValueError(
+            f"Environment variable '{env_var}' for {field_name} is not set"
+        )
+    return env_value
+
+
+# How long listings that feed fzf (parameter/secret names) are reused across
+# invocations. Short enough that newly created entries show up quickly.
+LIST_CACHE_TTL = 60
+
+
+def cache_dir(*parts: str) -> Path:
+    """
+    Return the cloudutil cache directory, creating it if needed.
+
+    Honours ``XDG_CACHE_HOME`` and falls back to ``~/.cache``. Directories are
+    created with mode 0700 because cache entries may hold credentials.
+    """
+    base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    path = base.joinpath("cloudutil", *parts)
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    return path
+
+
+def _cache_file(namespace: str, key: Any) -> Path:
+    raw_key = json.dumps(key, sort_keys=True, default=str).encode()
+    digest = hashlib.blake2b(raw_key, digest_size=16).hexdigest()
+    return cache_dir(namespace) / f"{digest}.json"
+
+
+def cache_get(namespace: str, key: Any) -> Any:
+    """
+    Return the cached value for *key* in *namespace*, or None.
+
+    Expired, unreadable, or corrupt entries are treated as misses.
+    """
+    try:
+        path = _cache_file(namespace, key)
+        entry = json.loads(path.read_bytes())
+        if entry["expires_at"] > time.time():
+            return entry["value"]
+        path.unlink(missing_ok=True)
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def cache_set(namespace: str, key: Any, value: Any, ttl: float) -> None:
+    """
+    Store a JSON-serialisable *value* for *key* in *namespace* for *ttl* seconds.
+
+    Entries are written with mode 0600. Failures are logged and ignored so a
+    read-only or full cache directory never breaks a command.
+    """
+    if ttl <= 0:
+        return
+    try:
+        path = _cache_file(namespace, key)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump({"expires_at": time.time() + ttl, "value": value}, f)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug("Could not write %s cache entry: %s", namespace, e)
@@ -0,0 +1,58 @@
+import stat
+import sys
+import textwrap
+import time
+
+import pytest
+
+from cloudutil.helper import fzf_view
+
+
+@pytest.fixture(autouse=True)
+def aws_env_credentials(monkeypatch):
+    """Use fake env credentials so nothing resolves a real AWS identity."""
+    monkeypatch.delenv("AWS_PROFILE", raising=False)
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "AKIDTEST")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "secret")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+
+
+@pytest.fixture
+def fake_fzf(tmp_path, monkeypatch):
+    """
+    Replace fzf with a script that selects the first item it receives.
+
+    Returns a callable that waits (up to *timeout* seconds) for that item to
+    reach the script and returns it, or None if it never arrived. Call it from
+    inside an item generator to check that input streams into fzf.
+    """
+    marker = tmp_path / "received"
+    script = tmp_path / "fzf"
+    script.write_text(
+        textwrap.dedent(
+            f"""\
+            #!{sys.executable}
+            import sys
+
+            data = b""
+            while b"\\0" not in data:
+                chunk = sys.stdin.buffer.read1(4096)
+                if not chunk:
+                    break
+                data += chunk
+            first = data.split(b"\\0", 1)[0]
+            open({str(marker)!r}, "wb").write(first)
+            sys.stdout.buffer.write(first + b"\\0")
+            """
+        )
+    )
+    script.chmod(script.stat().st_mode | stat.S_IXUSR)
+    monkeypatch.setattr(fzf_view, "fzf_executable", lambda: str(script))
+
+    def received(timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not marker.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return marker.read_text() if marker.exists() else None
+
+    return received
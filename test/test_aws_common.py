@@ -0,0 +1,9 @@
+from cloudutil.aws.common import cache_scope
+
+
+def test_cache_scope_keys_on_env_access_key(monkeypatch):
+    first = cache_scope()
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "AKIDOTHER")
+
+    assert first == ["AKIDTEST", "us-east-1"]
+    assert cache_scope() != first
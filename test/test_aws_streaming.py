@@ -0,0 +1,90 @@
+from cloudutil.aws import secrets, ssm
+
+
+class _FakePaginator:
+    def __init__(self, pages, on_next_page):
+        self._pages = pages
+        self._on_next_page = on_next_page
+
+    def paginate(self, **kwargs):
+        for i, page in enumerate(self._pages):
+            if i:
+                self._on_next_page()
+            yield page
+
+
+class _FakeClient:
+    def __init__(self, paginator):
+        self._paginator = paginator
+
+    def get_paginator(self, name):
+        return self._paginator
+
+
+def test_ssm_parameter_names_stream_into_fzf(fake_fzf, monkeypatch):
+    seen_before_next_page = []
+    pages = [
+        {"Parameters": [{"Name": "/app/first"}]},
+        {"Parameters": [{"Name": "/app/second"}]},
+    ]
+    paginator = _FakePaginator(pages, lambda: seen_before_next_page.append(fake_fzf()))
+    monkeypatch.setattr(ssm, "get_ssm_client", lambda *a: _FakeClient(paginator))
+    monkeypatch.setattr(ssm, "cache_set", lambda *a, **kw: None)
+
+    view = ssm.SSMParametersView("/app", use_cache=False)
+    selected = []
+    monkeypatch.setattr(view, "display_selection", selected.extend)
+    view.run()
+
+    assert seen_before_next_page == ["/app/first"]
+    assert selected == ["/app/first"]
+
+
+class _FakeSecretsClient:
+    def __init__(self, pages, on_next_page):
+        self._pages = pages
+        self._on_next_page = on_next_page
+
+    def list_secrets(self, **kwargs):
+        if "NextToken" not in kwargs:
+            return {"SecretList": self._pages[0], "NextToken": "1"}
+        self._on_next_page()
+        return {"SecretList": self._pages[int(kwargs["NextToken"])]}
+
+
+def test_secret_names_stream_into_fzf(fake_fzf, monkeypatch):
+    seen_before_next_page = []
+    client = _FakeSecretsClient(
+        [[{"Name": "app/first"}], [{"Name": "app/second"}]],
+        lambda: seen_before_next_page.append(fake_fzf()),
+    )
+    monkeypatch.setattr(secrets, "get_secrets_client", lambda *a: client)
+    monkeypatch.setattr(secrets, "cache_set", lambda *a, **kw: None)
+
+    view = secrets.AwsSecretsView(use_cache=False)
+    selected = []
+    monkeypatch.setattr(view, "display_selection", selected.extend)
+    view.run()
+
+    assert seen_before_next_page == ["app/first"]
+    assert selected == ["app/first"]
+
+
+def test_selected_secret_keeps_list_secrets_description(monkeypatch):
+    class Client:
+        def list_secrets(self, **kwargs):
+            return {"SecretList": [{"Name": "app/db", "Description": "db creds"}]}
+
+        def get_secret_value(self, SecretId):
+            return {"Name": SecretId, "SecretString": "{}", "ARN": "arn:x"}
+
+    monkeypatch.setattr(secrets, "get_secrets_client", lambda *a: Client())
+    monkeypatch.setattr(secrets, "cache_set", lambda *a, **kw: None)
+
+    view = secrets.AwsSecretsView(use_cache=False)
+    assert list(view.iter_items()) == ["app/db"]
+    view.display_item("app/db")
+
+    assert view._selected_secrets == [
+        secrets.Secret("app/db", "{}", arn="arn:x", description="db creds")
+    ]
@@ -0,0 +1,44 @@
+import orjson
+from typer.testing import CliRunner
+
+from cloudutil.azure import cli
+from cloudutil.azure.secrets import Secret
+
+runner = CliRunner()
+
+
+def _select(*selected):
+    return lambda **kwargs: list(selected)
+
+
+def test_text_report_pretty_prints_json_values(monkeypatch):
+    monkeypatch.setattr(
+        cli,
+        "search_secrets_with_fzf",
+        _select(
+            Secret(name="db", value='{"user":"app","port":5432}'),
+            Secret(name="token", value="[bold]abc"),
+        ),
+    )
+
+    result = runner.invoke(cli.app, ["--vault", "v"])
+
+    assert result.exit_code == 0
+    assert 'Value (JSON):\n{\n  "user": "app",\n  "port": 5432\n}\n' in result.stdout
+    assert "Value: [bold]abc\n" in result.stdout
+
+
+def test_json_output_lists_selection_in_order(monkeypatch):
+    monkeypatch.setattr(
+        cli,
+        "search_secrets_with_fzf",
+        _select(Secret(name="b", value="2"), Secret(name="a", value="1", id="x")),
+    )
+
+    result = runner.invoke(cli.app, ["--vault", "v", "-o", "json"])
+
+    assert result.exit_code == 0
+    assert orjson.loads(result.stdout) == [
+        {"name": "b", "value": "2", "id": None, "description": None},
+        {"name": "a", "value": "1", "id": "x", "description": None},
+    ]
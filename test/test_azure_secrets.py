@@ -0,0 +1,52 @@
+import time
+
+import orjson
+
+from cloudutil.azure import secrets
+
+
+def _fake_get_secret(vault_name, name):
+    # Fetch earlier selections slower so concurrent results complete in reverse.
+    time.sleep({"a": 0.05, "b": 0.025}.get(name, 0))
+    return secrets.Secret(name=name, value=f"value-{name}")
+
+
+def test_search_returns_selected_secrets_in_selection_order(monkeypatch, capsys):
+    clients = []
+    monkeypatch.setattr(secrets, "get_secret_client", clients.append)
+    monkeypatch.setattr(secrets, "get_secret", _fake_get_secret)
+    monkeypatch.setattr(
+        secrets.AzureSecretsView,
+        "run",
+        lambda self: self.display_selection(["a", "b", "c"]),
+    )
+
+    selected = secrets.search_secrets_with_fzf("vault", use_cache=False)
+
+    assert [s.name for s in selected] == ["a", "b", "c"]
+    assert clients == ["vault"]
+    assert capsys.readouterr().out == ""
+
+
+def test_cache_scope_follows_active_az_account(tmp_path, monkeypatch):
+    monkeypatch.setenv("AZURE_CONFIG_DIR", str(tmp_path))
+    monkeypatch.delenv("AZURE_TENANT_ID", raising=False)
+    monkeypatch.delenv("AZURE_CLIENT_ID", raising=False)
+
+    def login(user, tenant):
+        profile = {
+            "subscriptions": [
+                {"isDefault": False, "user": {"name": "old"}, "tenantId": "t0"},
+                {"isDefault": True, "user": {"name": user}, "tenantId": tenant},
+            ]
+        }
+        (tmp_path / "azureProfile.json").write_bytes(
+            b"\xef\xbb\xbf" + orjson.dumps(profile)
+        )
+
+    login("alice@example.com", "t1")
+    first = secrets.cache_scope()
+    login("bob@example.com", "t2")
+
+    assert first == [None, None, "alice@example.com", "t1"]
+    assert secrets.cache_scope() != first
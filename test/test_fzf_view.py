@@ -0,0 +1,13 @@
+from cloudutil.helper import fzf_view
+
+
+def test_first_item_reaches_fzf_before_generator_finishes(fake_fzf):
+    seen_before_second = []
+
+    def items():
+        yield "first"
+        seen_before_second.append(fake_fzf())
+        yield "second"
+
+    assert fzf_view._run_fzf(items()) == ["first"]
+    assert seen_before_second == ["first"]
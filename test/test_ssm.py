@@ -0,0 +1,28 @@
+from cloudutil.aws import ssm
+
+
+class _FakeClient:
+    def get_parameters(self, Names, WithDecryption):
+        # GetParameters does not promise to return parameters in request order.
+        return {
+            "Parameters": [
+                {"Name": name, "Value": f"fresh-{name}", "Type": "String"}
+                for name in reversed(Names)
+            ]
+        }
+
+
+def test_parameters_batch_keeps_name_order_with_cache_hits(monkeypatch):
+    monkeypatch.setattr(ssm, "get_ssm_client", lambda *a: _FakeClient())
+    monkeypatch.setattr(
+        ssm, "cache_get", lambda ns, key: "cached-b" if key[0] == "/b" else None
+    )
+    monkeypatch.setattr(ssm, "cache_set", lambda *a, **kw: None)
+
+    params = list(ssm.get_parameters_batch(["/a", "/b", "/c"], use_cache=True))
+
+    assert params == [
+        ssm.SSMParameter("/a", "fresh-/a"),
+        ssm.SSMParameter("/b", "cached-b"),
+        ssm.SSMParameter("/c", "fresh-/c"),
+    ]